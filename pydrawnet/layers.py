@@ -4,48 +4,431 @@
 # This source code is licensed under the BSD-style license found in the
 # LICENSE file in the root directory of this source tree.
 
-from matplotlib.collections import PatchCollection
-from matplotlib.pyplot import imread
-from matplotlib.axes._base import _TransformedBoundsLocator
-from matplotlib.patches import Rectangle, Circle, Polygon
-from matplotlib.image import AxesImage
+from functools import lru_cache
+import numpy as np
+
+# Fill color of the placeholder circles drawn for limited layers
+_PLACEHOLDER_COLOR = (0.1, 0.1, 0.1)
+
+
+@lru_cache(maxsize=64)
+def _cached_rgba(color):
+    from matplotlib.colors import to_rgba
+
+    return to_rgba(color)
+
+
+def _rgba(color):
+    """Returns <color> as an RGBA tuple, so that each distinct layer color is only
+    parsed once"""
+    try:
+        return _cached_rgba(color)
+    except TypeError:
+        # Unhashable colors, such as lists, are converted every time
+        from matplotlib.colors import to_rgba
+
+        return to_rgba(color)
+
+
+def _face_colors(fill_color, count, ends, placeholders):
+    """
+    Returns a (count, 4) array of RGBA face colors, all <fill_color> except for
+    <placeholders> rows of the placeholder color inserted after the first <ends>
+    """
+    colors = np.empty((count, 4))
+    colors[:] = _rgba(fill_color)
+    colors[ends : ends + placeholders] = _rgba(_PLACEHOLDER_COLOR)
+    return colors
+
+
+def _rect_verts(X, Y, width, height):
+    """
+    Returns an (M, 4, 2) array with the corners of M axis-aligned rectangles,
+    ordered counter-clockwise from the bottom left like a Rectangle patch
+
+    Parameters
+    ----------
+    X : float or array-like
+        The location(s) of the left edges
+    Y : float or array-like
+        The location(s) of the bottom edges
+    width : float or array-like
+        Width of every rectangle, or of each one
+    height : float or array-like
+        Height of every rectangle, or of each one
+    """
+    X, Y = np.broadcast_arrays(np.atleast_1d(X), np.atleast_1d(Y))
+    verts = np.empty((len(X), 4, 2))
+    verts[:, 0, 0] = verts[:, 3, 0] = X
+    verts[:, 1, 0] = verts[:, 2, 0] = X + width
+    verts[:, 0, 1] = verts[:, 1, 1] = Y
+    verts[:, 2, 1] = verts[:, 3, 1] = Y + height
+    return verts
+
+
+@lru_cache(maxsize=1)
+def _rect_codes():
+    """Returns the read-only vertex codes of a closed rectangle path, matching
+    Rectangle patches"""
+    from matplotlib.path import Path
+
+    codes = np.array(
+        [Path.MOVETO, Path.LINETO, Path.LINETO, Path.LINETO, Path.CLOSEPOLY],
+        dtype=Path.code_type,
+    )
+    codes.flags.writeable = False
+    return codes
+
+
+def _rect_paths(verts):
+    """Returns a closed Path for each rectangle in an (M, 4, 2) <verts> array"""
+    from matplotlib.path import Path
+
+    codes = _rect_codes()
+    closed = np.concatenate([verts, verts[:, :1]], axis=1)
+    return [Path(v, codes) for v in closed]
+
+
+def _circle_paths(centers, radius):
+    """Returns a circular Path of <radius> around each of the (x, y) <centers>,
+    where <radius> is either shared or given per circle"""
+    from matplotlib.path import Path
+
+    unit = Path.unit_circle()
+    centers = np.asarray(centers, dtype=np.float64).reshape(-1, 2)
+    radius = np.broadcast_to(np.asarray(radius, dtype=np.float64), len(centers))
+    verts = unit.vertices * radius[:, None, None] + centers[:, None, :]
+    return [Path(v, unit.codes) for v in verts]
+
+
+def _shown_indices(count, limited, ends, skip_ival):
+    """
+    Returns the indices of the items drawn in full, and of those replaced by
+    placeholder circles, for a layer of <count> items
+
+    Parameters
+    ----------
+    count : int
+        The total number of items (channels or features)
+    limited : int
+        If non-zero, then only this many item positions are used
+    ends : int
+        How many items are still drawn in full on each end when limited
+    skip_ival : int
+        The interval at which placeholders are drawn between the ends
+    """
+    if limited <= 0:
+        return np.arange(count), np.arange(0)
+
+    between = max(0, limited - 2 * ends)
+    shown = np.concatenate([np.arange(ends), np.arange(ends) + ends + between])
+    placeholders = np.arange(0, between, skip_ival) + ends
+    return shown, placeholders
+
+
+def _simplify_coords(coords, tolerance):
+    """
+    Simplifies the closed polygon <coords> with the Ramer-Douglas-Peucker
+    algorithm, dropping points that lie within <tolerance> of the simplified
+    outline. The original points are returned if fewer than 3 would remain
+
+    Parameters
+    ----------
+    coords : iterable of (x, y) pairs
+        The polygon points
+    tolerance : float
+        The largest distance a dropped point may be from the simplified outline
+    """
+    points = np.asarray(coords, dtype=np.float64)
+    ring = np.concatenate([points, points[:1]])
+
+    keep = np.zeros(len(ring), dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(ring) - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+
+        # Distance of each point between <start> and <end> from the line joining them
+        a = ring[start]
+        dx, dy = ring[end] - a
+        inner = ring[start + 1 : end] - a
+        norm = np.hypot(dx, dy)
+        if norm > 0:
+            dist = np.abs(dx * inner[:, 1] - dy * inner[:, 0]) / norm
+        else:
+            dist = np.hypot(inner[:, 0], inner[:, 1])
+
+        i = int(np.argmax(dist))
+        if dist[i] > tolerance:
+            mid = start + 1 + i
+            keep[mid] = True
+            stack.append((start, mid))
+            stack.append((mid, end))
+
+    simplified = ring[keep][:-1]
+    return simplified if len(simplified) >= 3 else points
+
+
+def _merge_key(coll):
+    """
+    Returns a hashable key of the properties that a merged PathCollection can only
+    hold once, or None if <coll> has to be drawn as-is (e.g. it is hatched, offset,
+    scaled, colormapped or clipped)
+    """
+    from matplotlib.transforms import IdentityTransform
+
+    alpha = coll.get_alpha()
+    if (
+        coll.get_hatch() is not None
+        or coll.get_array() is not None
+        or np.ndim(alpha) > 0
+        or coll.get_clip_box() is not None
+        or coll.get_clip_path() is not None
+        or coll.get_path_effects()
+        or coll.get_sketch_params() is not None
+        or len(getattr(coll, "get_sizes", tuple)()) > 0
+        or not isinstance(coll.get_offset_transform(), IdentityTransform)
+        or np.any(coll.get_offsets())
+    ):
+        return None
+
+    linestyles = tuple(
+        (offset, None if dashes is None else tuple(dashes))
+        for offset, dashes in coll.get_linestyle()
+    )
+    key = (
+        id(coll.get_transform()) if coll.is_transform_set() else None,
+        coll.get_zorder(),
+        alpha,
+        linestyles,
+        tuple(coll.get_antialiased()),
+        coll.get_joinstyle(),
+        coll.get_capstyle(),
+        coll.get_visible(),
+        coll.get_clip_on(),
+        coll.get_label(),
+        coll.get_gid(),
+        coll.get_url(),
+        coll.get_picker(),
+        coll.get_rasterized(),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _merge_run(colls):
+    """Returns a single PathCollection drawing <colls>, which share a _merge_key"""
+    from matplotlib.collections import PathCollection
+
+    if len(colls) == 1:
+        return colls[0]
+
+    paths = []
+    facecolors = []
+    edgecolors = []
+    linewidths = []
+    for coll in colls:
+        coll_paths = coll.get_paths()
+        n = len(coll_paths)
+        paths.extend(coll_paths)
+        facecolors.append(np.broadcast_to(coll.get_facecolor(), (n, 4)))
+        edgecolors.append(np.broadcast_to(coll.get_edgecolor(), (n, 4)))
+        linewidths.append(np.broadcast_to(coll.get_linewidth(), (n,)))
+
+    # Shared properties come from the first collection, per-path ones from each
+    first = colls[0]
+    merged = PathCollection(paths)
+    merged.update_from(first)
+    merged.set(
+        zorder=first.get_zorder(),
+        gid=first.get_gid(),
+        url=first.get_url(),
+        picker=first.get_picker(),
+        rasterized=first.get_rasterized(),
+        facecolor=np.concatenate(facecolors),
+        edgecolor=np.concatenate(edgecolors),
+        linewidth=np.concatenate(linewidths),
+    )
+    if first.get_joinstyle() is not None:
+        merged.set_joinstyle(first.get_joinstyle())
+    if first.get_capstyle() is not None:
+        merged.set_capstyle(first.get_capstyle())
+    return merged
+
+
+def merge_collections(items):
+    """
+    Combines the PatchCollections, PolyCollections and PathCollections returned
+    by layer make_collection calls into as few PathCollections as possible, so the
+    axis has fewer artists to add and draw
+
+    Only consecutive collections whose other properties (zorder, alpha, line
+    style, transform, etc.) match are merged, with each path keeping its own face
+    color, edge color and line width. Collections which can't be merged without
+    losing properties (e.g. hatched ones) and any other items (e.g. images) are
+    returned unchanged. The original drawing order is kept, and None items are
+    dropped.
+
+    Parameters
+    ----------
+    items : list
+        The values returned by make_collection for each layer
+    """
+    from matplotlib.collections import PatchCollection, PathCollection, PolyCollection
+
+    # Collections whose paths may already be in data coordinates
+    mergeable = (PatchCollection, PolyCollection, PathCollection)
+
+    out = []
+    run = []
+    run_key = None
+    for item in items:
+        if item is None:
+            continue
+        key = _merge_key(item) if type(item) in mergeable else None
+        if run and key != run_key:
+            out.append(_merge_run(run))
+            run = []
+        if key is None:
+            out.append(item)
+        else:
+            run.append(item)
+            run_key = key
+    if run:
+        out.append(_merge_run(run))
+    return out
 
 
 class BaseLayer:
     """Base class for adding graphics to the visualization"""
 
+    __slots__ = (
+        "X",
+        "Y",
+        "width",
+        "height",
+        "tot_width",
+        "tot_height",
+        "loc",
+        "text",
+        "text_kwargs",
+        "patches",
+        "colors",
+        "_corners_cached",
+        "_corners_arr",
+        "_extents",
+        "_cache_token",
+        "_paths",
+        "_paths_key",
+    )
+
+    # Diagonal layers are labelled relative to Y itself rather than their top edge
+    is_diagonal = False
+
     def __init__(
         self,
         X: float = 0,
-        Y: float = "auto",
+        Y: float | None = None,
         width: float = 100,
         height: float = 100,
         loc: str = "above",
         text_kwargs: dict | None = None,
     ) -> None:
         self.X = X
-        self.Y = Y
+        # None marks a Y position that is worked out from the layer size. The
+        # older "auto" string is still accepted
+        self.Y = None if isinstance(Y, str) else Y
 
         self.width = width
         self.height = height
 
         self.loc = loc
-        self.text_kwargs = text_kwargs
+        self.text_kwargs = text_kwargs or {}
 
         self.patches = None
         self.colors = None
 
+        self._corners_cached = None
+        self._corners_arr = None
+        self._extents = None
+        self._cache_token = None
+
+        self._paths = None
+        self._paths_key = None
+
     def get_extents(self):
-        """Returns the tuple (Xmin, Xmax, Ymin, Ymax) describing the limits of the layer"""
+        """Returns the tuple (Xmin, Xmax, Ymin, Ymax) describing the limits of the layer
+
+        Cached together with the corners, so it is only recalculated after the
+        position or size of the layer changes.
+        """
         TL, _, _, BR = self.get_corners()
 
-        # Xmin, Xmax, Ymin, Ymax
-        return (TL[0], BR[0], BR[1], TL[1])
+        if self._extents is None:
+            # Xmin, Xmax, Ymin, Ymax
+            self._extents = (TL[0], BR[0], BR[1], TL[1])
+        return self._extents
 
     def calc_overall_sizes(self):
         raise NotImplementedError("Function must be overridden in subclass.")
 
     def get_corners(self):
+        """Used to find attachment points for operation visualizations
+
+        Returns (x, y) coordinates in format: (Top Left, Top Right, Bottom Left, Bottom Right)
+
+        The corners are cached until the position or size of the layer changes, so
+        repeated calls by operations sharing this layer are O(1) amortized.
+        """
+        token = self._layout_token()
+        if token != self._cache_token:
+            self._corners_cached = self._calc_corners()
+            self._corners_arr = None
+            self._extents = None
+            self._cache_token = token
+        return self._corners_cached
+
+    def get_corners_array(self):
+        """Returns the corners from get_corners as a read-only (4, 2) float array
+
+        Rows are in the same order: (Top Left, Top Right, Bottom Left, Bottom Right)
+        """
+        corners = self.get_corners()
+        if self._corners_arr is None:
+            self._corners_arr = np.array(corners, dtype=np.float64)
+            self._corners_arr.flags.writeable = False
+        return self._corners_arr
+
+    def _layout_token(self):
+        """Returns the attributes which determine the layer corners, for cache validation"""
+        return (
+            self.X,
+            self.Y,
+            self.width,
+            self.height,
+            getattr(self, "tot_width", None),
+            getattr(self, "tot_height", None),
+        )
+
+    def _cached_paths(self, build, *params):
+        """Returns the paths made by <build>, reusing those from the previous call
+        while the layer layout and the other geometry <params> are unchanged
+
+        Paths are kept rather than collections, since a collection can only be
+        drawn on one axis and each render merges the layer graphics anew.
+        """
+        key = (self._layout_token(), params)
+        if key != self._paths_key:
+            self._paths = build()
+            self._paths_key = key
+        return self._paths
+
+    def _calc_corners(self):
         raise NotImplementedError("Function must be overridden in subclass.")
 
     def make_collection(self):
@@ -55,6 +438,17 @@ class BaseLayer:
 class Layer2D(BaseLayer):
     """For adding diagonally stacked-rectangle visualizations"""
 
+    __slots__ = (
+        "channels",
+        "cspace",
+        "limited",
+        "limited_radius",
+        "skip_ival",
+        "end_channels",
+        "color_dark",
+        "color_light",
+    )
+
     def __init__(
         self,
         channels: int = 3,
@@ -68,7 +462,7 @@ class Layer2D(BaseLayer):
         end_channels: int = 3,
         loc: str = "above",
         X: float = 0,
-        Y: float | str = "auto",
+        Y: float | None = None,
         text_kwargs: dict | None = None,
         color_dark: tuple = (0.4, 0.4, 0.4),
         color_light: tuple = (0.7, 0.7, 0.7),
@@ -103,10 +497,10 @@ class Layer2D(BaseLayer):
         X : float
             The location of the leftmost edge of base rectangle, set
             automatically when using NetGraph for rendering
-        Y : float (default: 'auto')
+        Y : float, or None (default)
             The location of the bottom edge of the base rectangle.
-            Specifying 'auto' will place the entire graphic symmetrically
-            about 0
+            Specifying None (or 'auto') will place the entire graphic
+            symmetrically about 0
         text_kwargs : dict, or None (default)
             Keyword arguments to be passed to matplotlib Text object
         color_dark : RGB tuple(float, float, float)
@@ -151,10 +545,10 @@ class Layer2D(BaseLayer):
         self.tot_width = self.width + num * self.cspace
         self.tot_height = self.height + num * self.cspace
 
-        if self.Y == "auto":
+        if self.Y is None:
             self.Y = self.tot_height / 2 - self.height
 
-    def get_corners(self):
+    def _calc_corners(self):
         """Used to find attachment points for operation visualizations
 
         Returns (x, y) coordinates in format: (Top Left, Top Right, Bottom Left, Bottom Right)
@@ -162,7 +556,7 @@ class Layer2D(BaseLayer):
         if (
             not hasattr(self, "tot_width")
             or not hasattr(self, "tot_height")
-            or isinstance(self.Y, str)
+            or self.Y is None
         ):
             raise AttributeError("<self.calc_overall_sizes> must be run first")
 
@@ -177,79 +571,84 @@ class Layer2D(BaseLayer):
         ]
         return corners
 
+    def _shown_channels(self):
+        """Returns the indices of the channels drawn as rectangles, and of those
+        drawn as placeholder circles"""
+        return _shown_indices(
+            self.channels, self.limited, self.end_channels, self.skip_ival
+        )
+
+    def rect_verts(self):
+        """Returns the (M, 4, 2) corners of every channel drawn as a rectangle,
+        front first"""
+        offsets = self.cspace * self._shown_channels()[0]
+        return _rect_verts(self.X + offsets, self.Y - offsets, self.width, self.height)
+
+    def _make_paths(self):
+        """Returns the paths of the channel rectangles and placeholder circles, with
+        the placeholders between the front and back end channels"""
+        verts = self.rect_verts()
+        if self.limited <= 0:
+            return _rect_paths(verts)
+
+        offsets = self.cspace * self._shown_channels()[1]
+        centers = np.column_stack(
+            [
+                self.X + offsets + self.width / 2,
+                self.Y - offsets + self.height / 2,
+            ]
+        )
+        ends = self.end_channels
+        return (
+            _rect_paths(verts[:ends])
+            + _circle_paths(centers, self.limited_radius)
+            + _rect_paths(verts[ends:])
+        )
+
     def make_collection(self):
-        """Generates a PatchCollection containing all graphics to be drawn other than text"""
-        patches = []
-        colors = []
-        color_toggle = False
+        """Generates a collection containing all graphics to be drawn other than text"""
+        from matplotlib.collections import PathCollection
 
         self.calc_overall_sizes()
 
-        if self.limited > 0:
-            # Reduce the number of shown channels, only showing some on the ends, if any
-
-            # Add end channels
-            for i in range(self.end_channels):
-                patches.append(
-                    Rectangle(
-                        (self.X + self.cspace * i, self.Y - self.cspace * i),
-                        self.width,
-                        self.height,
-                    )
-                )
-                colors.append(self.color_dark if color_toggle else self.color_light)
-                color_toggle = not color_toggle
-
-            # Add placeholders
-            ioffset = self.end_channels
-            for i in range(self.limited - 2 * self.end_channels):
-                if i % self.skip_ival == 0:
-                    patches.append(
-                        Circle(
-                            (
-                                self.X + self.cspace * (i + ioffset) + self.width / 2,
-                                self.Y - self.cspace * (i + ioffset) + self.height / 2,
-                            ),
-                            self.limited_radius,
-                        )
-                    )
-                    colors.append((0.1, 0.1, 0.1))
-
-            # Add remaining end channels
-            ioffset = self.end_channels + max(0, self.limited - 2 * self.end_channels)
-            for i in range(self.end_channels):
-                patches.append(
-                    Rectangle(
-                        (
-                            self.X + self.cspace * (i + ioffset),
-                            self.Y - self.cspace * (i + ioffset),
-                        ),
-                        self.width,
-                        self.height,
-                    )
-                )
-                colors.append(self.color_dark if color_toggle else self.color_light)
-                color_toggle = not color_toggle
+        paths = self._cached_paths(
+            self._make_paths,
+            self.channels,
+            self.cspace,
+            self.limited,
+            self.end_channels,
+            self.skip_ival,
+            self.limited_radius,
+        )
+        shown, placeholders = self._shown_channels()
 
-        else:
-            # Show all channels
-            for i in range(self.channels):
-                patches.append(
-                    Rectangle(
-                        (self.X + self.cspace * i, self.Y - self.cspace * i),
-                        self.width,
-                        self.height,
-                    )
-                )
-                colors.append(self.color_dark if color_toggle else self.color_light)
-                color_toggle = not color_toggle
+        ends = self.end_channels if self.limited > 0 else len(shown)
+        colors = _face_colors(
+            self.color_light, len(shown) + len(placeholders), ends, len(placeholders)
+        )
 
-        return PatchCollection(patches, ec="k", fc=colors)
+        # Channel colors alternate, starting with the light color
+        dark = _rgba(self.color_dark)
+        colors[1:ends:2] = dark
+        colors[ends + len(placeholders) + (ends % 2 == 0) :: 2] = dark
+        return PathCollection(paths, ec="k", fc=colors)
 
 
 class Layer1D(BaseLayer):
     """For adding vertically-stacked circle visualizations"""
 
+    __slots__ = (
+        "diameter",
+        "features",
+        "fill_color",
+        "limited",
+        "limited_radius",
+        "skip_ival",
+        "end_features",
+        "shape_spacing",
+        "yival",
+    )
+
     def __init__(
         self,
         features: int = 9,
@@ -263,7 +662,7 @@ class Layer1D(BaseLayer):
         shape_spacing: float = 0,
         loc: str = "above",
         X: float = 0,
-        Y: float | str = "auto",
+        Y: float | None = None,
         text_kwargs: dict | None = None,
     ) -> None:
         """
@@ -296,10 +695,10 @@ class Layer1D(BaseLayer):
         X : float
             The location of the leftmost edge of base circle, set
             automatically when using NetGraph for rendering
-        Y : float (default: 'auto')
+        Y : float, or None (default)
             The location of the bottom edge of the base circle.
-            Specifying 'auto' will place the entire graphic symmetrically
-            about 0
+            Specifying None (or 'auto') will place the entire graphic
+            symmetrically about 0
         text_kwargs : dict, or None (default)
             Keyword arguments to be passed to matplotlib Text object
         """
@@ -338,10 +737,10 @@ class Layer1D(BaseLayer):
         self.tot_height = (
             self.diameter + self.shape_spacing
         ) * num_features - self.shape_spacing
-        if self.Y == "auto":
+        if self.Y is None:
             self.Y = self.tot_height / 2 - self.diameter
 
-    def get_corners(self):
+    def _calc_corners(self):
         """Used to find attachment points for operation visualizations
 
         Returns (x, y) coordinates in format: (Top Left, Top Right, Bottom Left, Bottom Right)
@@ -349,7 +748,7 @@ class Layer1D(BaseLayer):
         if (
             not hasattr(self, "tot_width")
             or not hasattr(self, "tot_height")
-            or isinstance(self.Y, str)
+            or self.Y is None
         ):
             raise AttributeError("<self.calc_overall_sizes> must be run first")
 
@@ -361,79 +760,72 @@ class Layer1D(BaseLayer):
         ]
         return corners
 
-    def make_collection(self):
-        """Generates a PatchCollection containing all graphics to be drawn other than text
-
-        Parameters
-        ----------
-        skip_ival : int
-            When replacing channels with dots, at what interval should the dots be drawn
-        radius : float (default: 'auto')
-            The radius of each dot. if 'auto' is specified, then radius = width/4
-        """
-
-        self.calc_overall_sizes()
+    def _shown_features(self):
+        """Returns the indices of the features drawn in full, and of those drawn as
+        placeholder circles"""
+        return _shown_indices(
+            self.features, self.limited, self.end_features, self.skip_ival
+        )
 
-        self.patches = []
-        self.colors = []
+    def _make_paths(self):
+        """Returns the paths of the feature and placeholder circles, with the
+        placeholders between the front and back end features"""
         rad = self.diameter / 2
+        shown, placeholders = self._shown_features()
+
+        ends = self.end_features if self.limited > 0 else len(shown)
+        order = np.concatenate([shown[:ends], placeholders, shown[ends:]])
+        radii = np.concatenate(
+            [
+                np.full(ends, rad),
+                np.full(len(placeholders), self.limited_radius),
+                np.full(len(shown) - ends, rad),
+            ]
+        )
+        centers = np.column_stack(
+            [np.full(len(order), self.X + rad), self.Y - self.yival * order + rad]
+        )
+        return _circle_paths(centers, radii)
 
-        if self.limited:
-            # Reduce the number of shown features, only showing some on the ends, if any
-
-            # Add end channels
-            for i in range(self.end_features):
-                self.patches.append(
-                    Circle(
-                        (self.X + rad, self.Y - self.yival * i + rad),
-                        rad,
-                    )
-                )
-                self.colors.append(self.fill_color)
-
-            # Add placeholders
-            ioffset = self.end_features
-            for i in range(self.limited - 2 * self.end_features):
-                if i % self.skip_ival == 0:
-                    self.patches.append(
-                        Circle(
-                            (
-                                self.X + rad,
-                                self.Y - self.yival * (i + ioffset) + rad,
-                            ),
-                            self.limited_radius,
-                        )
-                    )
-                    self.colors.append((0.1, 0.1, 0.1))
-
-            # Add remaining end channels
-            ioffset = self.end_features + max(0, self.limited - 2 * self.end_features)
-            for i in range(self.end_features):
-                self.patches.append(
-                    Circle(
-                        (self.X + rad, self.Y - self.yival * (i + ioffset) + rad),
-                        rad,
-                    )
-                )
-                self.colors.append(self.fill_color)
+    def make_collection(self):
+        """Generates a collection containing all graphics to be drawn other than text"""
+        from matplotlib.collections import PathCollection
 
-        else:
-            # Show all features
-            for i in range(self.features):
-                self.patches.append(
-                    Circle(
-                        (self.X + rad, self.Y - self.yival * i + rad),
-                        rad,
-                    )
-                )
-                self.colors.append(self.fill_color)
+        self.calc_overall_sizes()
+
+        paths = self._cached_paths(
+            self._make_paths,
+            self.diameter,
+            self.yival,
+            self.features,
+            self.limited,
+            self.end_features,
+            self.skip_ival,
+            self.limited_radius,
+        )
+        shown, placeholders = self._shown_features()
 
-        return PatchCollection(self.patches, ec="k", fc=self.colors)
+        ends = self.end_features if self.limited > 0 else len(shown)
+        self.colors = _face_colors(
+            self.fill_color, len(shown) + len(placeholders), ends, len(placeholders)
+        )
+        return PathCollection(paths, ec="k", fc=self.colors)
 
 
 class Layer1DRect(BaseLayer):
     """For adding vertically-stacked rectangle visualizations"""
 
+    __slots__ = (
+        "features",
+        "fill_color",
+        "limited",
+        "limited_radius",
+        "skip_ival",
+        "end_features",
+        "shape_spacing",
+        "yival",
+    )
+
     def __init__(
         self,
         features: int = 9,
@@ -448,7 +840,7 @@ class Layer1DRect(BaseLayer):
         shape_spacing: float = 0,
         loc: str = "above",
         X: float = 0,
-        Y: float | str = "auto",
+        Y: float | None = None,
         text_kwargs: dict | None = None,
     ) -> None:
         """
@@ -481,10 +873,10 @@ class Layer1DRect(BaseLayer):
             Where the label text should be placed: "above" or "below" the layer
         X : float
             The location of the leftmost edge of base rectangle
-        Y : float (default: 'auto')
+        Y : float, or None (default)
             The location of the bottom edge of the base rectangle.
-            Specifying 'auto' will place the entire graphic symmetrically
-            about 0
+            Specifying None (or 'auto') will place the entire graphic
+            symmetrically about 0
         text_kwargs : dict, or None (default)
             Keyword arguments to be passed to matplotlib Text object
         """
@@ -513,10 +905,10 @@ class Layer1DRect(BaseLayer):
         self.tot_height = (
             self.height + self.shape_spacing
         ) * num_features - self.shape_spacing
-        if self.Y == "auto":
+        if self.Y is None:
             self.Y = self.tot_height / 2 - self.height
 
-    def get_corners(self):
+    def _calc_corners(self):
         """Used to find attachment points for operation visualizations
 
         Returns (x, y) coordinates in format: (Top Left, Top Right, Bottom Left, Bottom Right)
@@ -524,7 +916,7 @@ class Layer1DRect(BaseLayer):
         if (
             not hasattr(self, "tot_width")
             or not hasattr(self, "tot_height")
-            or isinstance(self.Y, str)
+            or self.Y is None
         ):
             raise AttributeError("<self.calc_overall_sizes> must be run first")
 
@@ -536,75 +928,74 @@ class Layer1DRect(BaseLayer):
         ]
         return corners
 
+    def _shown_features(self):
+        """Returns the indices of the features drawn as rectangles, and of those
+        drawn as placeholder circles"""
+        return _shown_indices(
+            self.features, self.limited, self.end_features, self.skip_ival
+        )
+
+    def rect_verts(self):
+        """Returns the (M, 4, 2) corners of every feature drawn as a rectangle,
+        top first"""
+        Y = self.Y - self.yival * self._shown_features()[0]
+        return _rect_verts(self.X, Y, self.width, self.height)
+
+    def _make_paths(self):
+        """Returns the paths of the feature rectangles and placeholder circles, with
+        the placeholders between the top and bottom end features"""
+        verts = self.rect_verts()
+        if self.limited <= 0:
+            return _rect_paths(verts)
+
+        placeholders = self._shown_features()[1]
+        centers = np.column_stack(
+            [
+                np.full(len(placeholders), self.X + self.width / 2),
+                self.Y
+                - self.yival * placeholders
+                + self.limited_radius / 2
+                + self.height / 2,
+            ]
+        )
+        ends = self.end_features
+        return (
+            _rect_paths(verts[:ends])
+            + _circle_paths(centers, self.limited_radius)
+            + _rect_paths(verts[ends:])
+        )
+
     def make_collection(self):
-        """Generates a PatchCollection containing all graphics to be drawn other than text"""
+        """Generates a collection containing all graphics to be drawn other than text"""
+        from matplotlib.collections import PathCollection
 
         self.calc_overall_sizes()
 
-        self.patches = []
-        self.colors = []
-
-        if self.limited > 0:
-            # Reduce the number of shown features, only showing some on the ends, if any
-
-            # Add end features
-            for i in range(self.end_features):
-                self.patches.append(
-                    Rectangle(
-                        (self.X, self.Y - self.yival * i),
-                        self.width,
-                        self.height,
-                    )
-                )
-                self.colors.append(self.fill_color)
-
-            # Add placeholders
-            ioffset = self.end_features
-            for i in range(self.limited - 2 * self.end_features):
-                if i % self.skip_ival == 0:
-                    self.patches.append(
-                        Circle(
-                            (
-                                self.X + self.width / 2,
-                                self.Y
-                                - self.yival * (i + ioffset)
-                                + self.limited_radius / 2
-                                + self.height / 2,
-                            ),
-                            self.limited_radius,
-                        )
-                    )
-                    self.colors.append((0.1, 0.1, 0.1))
-
-            # Add remaining end features
-            ioffset = self.end_features + max(0, self.limited - 2 * self.end_features)
-            for i in range(self.end_features):
-                self.patches.append(
-                    Rectangle(
-                        (self.X, self.Y - self.yival * (i + ioffset)),
-                        self.width,
-                        self.height,
-                    )
-                )
-                self.colors.append(self.fill_color)
+        paths = self._cached_paths(
+            self._make_paths,
+            self.yival,
+            self.features,
+            self.limited,
+            self.end_features,
+            self.skip_ival,
+            self.limited_radius,
+        )
+        shown, placeholders = self._shown_features()
 
-        else:
-            # Show all features
-            for i in range(self.features):
-                self.patches.append(
-                    Rectangle(
-                        (self.X, self.Y - self.yival * i),
-                        self.width,
-                        self.height,
-                    )
-                )
-                self.colors.append(self.fill_color)
-        return PatchCollection(self.patches, ec="k", fc=self.colors)
+        ends = self.end_features if self.limited > 0 else len(shown)
+        self.colors = _face_colors(
+            self.fill_color, len(shown) + len(placeholders), ends, len(placeholders)
+        )
+        return PathCollection(paths, ec="k", fc=self.colors)
 
 
 class Layer1DDiagonal(BaseLayer):
     """For adding single diagonal rectangle visualizations"""
 
+    __slots__ = ("fill_color",)
+
+    is_diagonal = True
+
     def __init__(
         self,
         width: float = 10,
@@ -613,7 +1004,7 @@ class Layer1DDiagonal(BaseLayer):
         fill_color: tuple = (0.9, 0.9, 0.9),
         loc: str = "above",
         X: float = 0,
-        Y: float | str = "auto",
+        Y: float | None = None,
         text_kwargs: dict | None = None,
     ) -> None:
         """
@@ -631,10 +1022,10 @@ class Layer1DDiagonal(BaseLayer):
             Where the label text should be placed: "above" or "below" the layer
         X : float
             The location of the leftmost edge of base rectangle
-        Y : float (default: 'auto')
+        Y : float, or None (default)
             The location of the bottom edge of the base rectangle.
-            Specifying 'auto' will place the entire graphic symmetrically
-            about 0
+            Specifying None (or 'auto') will place the entire graphic
+            symmetrically about 0
         text_kwargs : dict, or None (default)
             Keyword arguments to be passed to matplotlib Text object
         """
@@ -646,13 +1037,13 @@ class Layer1DDiagonal(BaseLayer):
         self.tot_width = width + hx
         self.tot_height = hx
 
-        if Y == "auto":
+        if self.Y is None:
             self.Y = self.tot_height / 2
 
     def calc_overall_sizes(self):
         """Unused"""
 
-    def get_corners(self):
+    def _calc_corners(self):
         """Used to find attachment points for operation visualizations
 
         Returns (x, y) coordinates in format: (Top Left, Top Right, Bottom Left, Bottom Right)
@@ -666,26 +1057,29 @@ class Layer1DDiagonal(BaseLayer):
         return corners
 
     def make_collection(self):
-        """Generates a PatchCollection containing all graphics to be drawn other than text"""
-
-        points = [
-            (self.X, self.Y),
-            (self.X + self.width, self.Y),
-            (self.X + self.tot_width, self.Y - self.tot_height),
-            (self.X + self.tot_width - self.width, self.Y - self.tot_height),
-        ]
-        self.patches = [Polygon(points)]
-        self.colors = [self.fill_color]
-        return PatchCollection(
-            self.patches,
-            ec="k",
-            fc=self.colors,
+        """Generates a PolyCollection containing all graphics to be drawn other than text"""
+        from matplotlib.collections import PolyCollection
+
+        verts = np.array(
+            [
+                [
+                    (self.X, self.Y),
+                    (self.X + self.width, self.Y),
+                    (self.X + self.tot_width, self.Y - self.tot_height),
+                    (self.X + self.tot_width - self.width, self.Y - self.tot_height),
+                ]
+            ],
+            dtype=np.float64,
         )
+        self.colors = [_rgba(self.fill_color)]
+        return PolyCollection(verts, ec="k", fc=self.colors)
 
 
 class BlockLayer(BaseLayer):
     """For adding single colored rectangle visualizations"""
 
+    __slots__ = ("fill_color",)
+
     def __init__(
         self,
         width: float = 100,
@@ -694,7 +1088,7 @@ class BlockLayer(BaseLayer):
         fill_color: tuple = (0.9, 0.9, 0.9),
         loc: str = "above",
         X: float = 0,
-        Y: float | str = "auto",
+        Y: float | None = None,
         text_kwargs: dict | None = None,
     ) -> None:
         """
@@ -710,10 +1104,10 @@ class BlockLayer(BaseLayer):
             RGB color to fill each rectangle with
         X : float
             The location of the leftmost edge of base rectangle
-        Y : float (default: 'auto')
+        Y : float, or None (default)
             The location of the bottom edge of the base rectangle.
-            Specifying 'auto' will place the entire graphic symmetrically
-            about 0
+            Specifying None (or 'auto') will place the entire graphic
+            symmetrically about 0
         text_kwargs : dict, or None (default)
             Keyword arguments to be passed to matplotlib Text object
         """
@@ -724,13 +1118,13 @@ class BlockLayer(BaseLayer):
         self.tot_width = width
         self.tot_height = height
 
-        if Y == "auto":
+        if self.Y is None:
             self.Y = -self.height / 2
 
     def calc_overall_sizes(self):
         """Unused"""
 
-    def get_corners(self):
+    def _calc_corners(self):
         """Used to find attachment points for operation visualizations
 
         Returns (x, y) coordinates in format: (Top Left, Top Right, Bottom Left, Bottom Right)
@@ -743,20 +1137,48 @@ class BlockLayer(BaseLayer):
         ]
         return corners
 
+    def rect_verts(self):
+        """Returns the (1, 4, 2) corners of the base rectangle"""
+        return _rect_verts(self.X, self.Y, self.width, self.height)
+
     def make_collection(self):
-        """Generates a PatchCollection containing all graphics to be drawn other than text"""
-        self.patches = [Rectangle((self.X, self.Y), self.width, self.height)]
-        self.colors = [self.fill_color]
-        return PatchCollection(
-            self.patches,
+        """Generates a PolyCollection containing all graphics to be drawn other than text"""
+        from matplotlib.collections import PolyCollection
+
+        self.colors = [_rgba(self.fill_color)]
+        return PolyCollection(self.rect_verts(), ec="k", fc=self.colors)
+
+    @staticmethod
+    def build_batch(layers):
+        """
+        Generates a single PolyCollection drawing every layer in <layers>, for
+        drawing many blocks directly onto an axis without a renderer
+
+        Parameters
+        ----------
+        layers : list of BlockLayer
+            The layers to draw, in drawing order
+        """
+        from matplotlib.collections import PolyCollection
+
+        X, Y, width, height = (
+            np.array([(c.X, c.Y, c.width, c.height) for c in layers], dtype=np.float64)
+            .reshape(-1, 4)
+            .T
+        )
+        verts = _rect_verts(X, Y, width, height)
+        return PolyCollection(
+            verts,
             ec="k",
-            fc=self.colors,
+            fc=np.array([_rgba(c.fill_color) for c in layers]).reshape(-1, 4),
         )
 
 
 class PolyLayer(BaseLayer):
     """For adding arbitrary polygon visualizations"""
 
+    __slots__ = ("coords", "fill_color", "simplify_tolerance")
+
     def __init__(
         self,
         coords,
@@ -766,6 +1188,7 @@ class PolyLayer(BaseLayer):
         X: float = 0,
         Y: float = 0,
         text_kwargs: dict | None = None,
+        simplify_tolerance: float | None = None,
     ) -> None:
         """
         Parameters
@@ -784,6 +1207,9 @@ class PolyLayer(BaseLayer):
             The location of the vertical center of the polygon
         text_kwargs : dict, or None (default)
             Keyword arguments to be passed to matplotlib Text object
+        simplify_tolerance : float, or None (default)
+            If given, points within this distance of the simplified outline are
+            dropped before drawing, which speeds up rendering dense polygons
         """
 
         width, height = self._width_height_from_coords(coords)
@@ -792,37 +1218,21 @@ class PolyLayer(BaseLayer):
         self.coords = coords
         self.text = label
         self.fill_color = fill_color
+        self.simplify_tolerance = simplify_tolerance
 
         self.tot_width = width
         self.tot_height = height
 
     def _width_height_from_coords(self, coords):
-        minX = None
-        maxX = None
-        minY = None
-        maxY = None
-
-        for x, y in coords:
-            if minX is None:
-                minX = x
-                maxX = x
-                minY = y
-                maxY = y
-            else:
-                minX = min(minX, x)
-                maxX = max(maxX, x)
-                minY = min(minY, y)
-                maxY = max(maxY, y)
-
-        width = maxX - minX
-        height = maxY - minY
+        points = np.asarray(coords, dtype=np.float64)
+        width, height = (points.max(axis=0) - points.min(axis=0)).tolist()
 
         return width, height
 
     def calc_overall_sizes(self):
         """Unused"""
 
-    def get_corners(self):
+    def _calc_corners(self):
         """Used to find attachment points for operation visualizations
 
         Returns (x, y) coordinates in format: (Top Left, Top Right, Bottom Left, Bottom Right)
@@ -836,16 +1246,22 @@ class PolyLayer(BaseLayer):
         return corners
 
     def make_collection(self):
-        """Generates a PatchCollection containing all graphics to be drawn other than text"""
+        """Generates a PolyCollection containing all graphics to be drawn other than text"""
+        from matplotlib.collections import PolyCollection
 
-        patches = [Polygon([(x + self.X, y + self.Y) for x, y in self.coords])]
-        colors = [self.fill_color]
-        return PatchCollection(patches, ec="k", fc=colors)
+        coords = self.coords
+        if self.simplify_tolerance is not None:
+            coords = _simplify_coords(coords, self.simplify_tolerance)
+
+        verts = np.asarray(coords, dtype=np.float64) + (self.X, self.Y)
+        return PolyCollection([verts], ec="k", fc=[_rgba(self.fill_color)])
 
 
 class ImageLayer(BaseLayer):
     """For adding single image visualizations"""
 
+    __slots__ = ("imgpath", "img_kwargs", "img")
+
     def __init__(
         self,
         imgpath,
@@ -854,7 +1270,7 @@ class ImageLayer(BaseLayer):
         label: str = "Image",
         loc: str = "above",
         X: float = 0,
-        Y: float | str = "auto",
+        Y: float | None = None,
         img_kwargs: dict | None = None,
         text_kwargs: dict | None = None,
     ) -> None:
@@ -869,33 +1285,34 @@ class ImageLayer(BaseLayer):
             Briefly describes the graphic
         X : float
             The location of the leftmost edge of base rectangle
-        Y : float (default: 'auto')
+        Y : float, or None (default)
             The location of the bottom edge of the base rectangle.
-            Specifying 'auto' will place the entire graphic symmetrically
-            about 0
+            Specifying None (or 'auto') will place the entire graphic
+            symmetrically about 0
         img_kwargs : dict | None
             Keyword arguments to be passed to matplotlib imshow
         text_kwargs : dict | None
             Keyword arguments to be passed to matplotlib Text object
         """
+        from matplotlib.image import imread
+
         super().__init__(X, Y, width, height, loc, text_kwargs)
         self.imgpath = imgpath
         self.text = label
         self.img_kwargs = img_kwargs
-        self.text_kwargs = text_kwargs
 
         self.img = imread(self.imgpath)
 
         self.tot_width = width
         self.tot_height = height
 
-        if Y == "auto":
+        if self.Y is None:
             self.Y = -self.height / 2
 
     def calc_overall_sizes(self):
         """Unused"""
 
-    def get_corners(self):
+    def _calc_corners(self):
         """Used to find attachment points for operation visualizations
 
         Returns (x, y) coordinates in format: (Top Left, Top Right, Bottom Left, Bottom Right)
@@ -910,6 +1327,8 @@ class ImageLayer(BaseLayer):
 
     def make_collection(self):
         """Returns the image to be shown"""
+        from matplotlib.image import AxesImage
+
         if self.img_kwargs is not None and "extent" not in self.img_kwargs.keys():
             self.img_kwargs["extent"] = (
                 self.X,
@@ -928,6 +1347,8 @@ class ImageLayer(BaseLayer):
 class PlotLayer(BaseLayer):
     """For adding matplotlib plots as visualizations"""
 
+    __slots__ = ("parent_axis", "transform", "axs")
+
     def __init__(
         self,
         parent_axis,
@@ -936,7 +1357,7 @@ class PlotLayer(BaseLayer):
         label: str = "Plot",
         loc: str = "above",
         X: float = 0,
-        Y: float | str = "auto",
+        Y: float | None = None,
         text_kwargs: dict | None = None,
     ) -> None:
         """
@@ -952,21 +1373,20 @@ class PlotLayer(BaseLayer):
             Briefly describes the graphic
         X : float
             The location of the leftmost edge of base rectangle
-        Y : float (default: 'auto')
+        Y : float, or None (default)
             The location of the bottom edge of the base rectangle.
-            Specifying 'auto' will place the entire graphic symmetrically
-            about 0
+            Specifying None (or 'auto') will place the entire graphic
+            symmetrically about 0
         text_kwargs : dict | None
             Keyword arguments to be passed to matplotlib Text object
         """
-        if Y == "auto":
+        if Y is None or isinstance(Y, str):
             Y = -height / 2
 
         super().__init__(X, Y, width, height, loc, text_kwargs)
         self.parent_axis = parent_axis
 
         self.text = label
-        self.text_kwargs = text_kwargs
 
         self.tot_width = width
         self.tot_height = height
@@ -981,7 +1401,7 @@ class PlotLayer(BaseLayer):
     def calc_overall_sizes(self):
         """Unused"""
 
-    def get_corners(self):
+    def _calc_corners(self):
         """Used to find attachment points for operation visualizations
 
         Returns (x, y) coordinates in format: (Top Left, Top Right, Bottom Left, Bottom Right)
@@ -999,6 +1419,8 @@ class PlotLayer(BaseLayer):
         self.update_position()
 
     def update_position(self):
+        from matplotlib.axes._base import _TransformedBoundsLocator
+
         # set_position doesn't work with inset_axes, so use this hack instead
         inset_locator = _TransformedBoundsLocator(
             (self.X, self.Y, self.width, self.height), self.transform
@@ -4,15 +4,18 @@
 # This source code is licensed under the BSD-style license found in the
 # LICENSE file in the root directory of this source tree.
 
-from matplotlib.collections import PatchCollection, LineCollection
-from matplotlib.patches import Rectangle, Circle, Polygon
-from matplotlib.text import Text
 from enum import Enum
-from math import sin, cos, pi
+from functools import lru_cache
+from math import sin, cos, radians
+import numpy as np
 
 # text_kwargs: https://matplotlib.org/stable/api/text_api.html#matplotlib.text.Text
 
 
+# Corners of a unit square, in the vertex order used for rectangles
+_UNIT_RECT = np.array([(0, 0), (1, 0), (1, 1), (0, 1)], dtype=np.float64)
+
+
 # TODO: keep?
 class Edges(Enum):
     TL = 0  # Top-Left
@@ -21,9 +24,23 @@ class Edges(Enum):
     BL = 3  # Bottom-Left
 
 
+@lru_cache(maxsize=64)
+def _rotation_matrix(rotation):
+    """
+    Returns the read-only 2x2 matrix which rotates row vectors by <rotation>
+    degrees, cached since the same few angles (e.g. +-90) are used repeatedly
+    """
+    rot = radians(rotation)
+    c, s = cos(rot), sin(rot)
+    R = np.array([(c, s), (-s, c)])
+    R.flags.writeable = False
+    return R
+
+
 def make_arrow(X, Y, W, H, rotation=0):
     """
-    Returns the line segment coordinates for a simple rotatable arrow
+    Returns the line segment coordinates for a simple rotatable arrow as a
+    (4, 2) float array
 
     Parameters
     ----------
@@ -38,30 +55,252 @@ def make_arrow(X, Y, W, H, rotation=0):
     rotation : float
         The angle of the arrow in degrees
     """
-    segments = [
-        (W / 2, 0),
-        (-W / 2, H / 2),
-        (-W / 2, -H / 2),
-        (W / 2, 0),
-    ]
-    if rotation != 0:
-        rot = rotation * pi / 180
-        new_segments = []
-        for x, y in segments:
-            new_segments.append(
-                (
-                    x * cos(rot) - y * sin(rot),
-                    x * sin(rot) + y * cos(rot),
-                )
+    segments = np.array(
+        [
+            (W / 2, 0),
+            (-W / 2, H / 2),
+            (-W / 2, -H / 2),
+            (W / 2, 0),
+        ],
+        dtype=np.float64,
+    )
+    # A single path for every angle; rotation=0 simply uses the identity matrix
+    return segments @ _rotation_matrix(rotation) + (X, Y)
+
+
+def make_arrows(X, Y, W, H, rotation=0):
+    """
+    Returns the line segment coordinates for many simple rotatable arrows at
+    once as an (N, 4, 2) float array, matching N calls to make_arrow
+
+    Parameters
+    ----------
+    X : float | array-like of float
+        The horizontal positions of the arrow centers
+    Y : float | array-like of float
+        The vertical positions of the arrow centers
+    W : float | array-like of float
+        The widths of the arrows
+    H : float | array-like of float
+        The heights of the arrows
+    rotation : float | array-like of float
+        The angles of the arrows in degrees
+    """
+    X, Y, W, H, rotation = np.broadcast_arrays(
+        *(np.atleast_1d(v) for v in (X, Y, W, H, rotation))
+    )
+    # Arrow template with unit width and height, scaled per arrow
+    points = (
+        np.array([(0.5, 0), (-0.5, 0.5), (-0.5, -0.5), (0.5, 0)], dtype=np.float64)
+        * np.stack((W, H), axis=-1)[:, None, :]
+    )
+    R = np.stack([_rotation_matrix(float(r)) for r in rotation])
+    return np.matmul(points, R) + np.stack((X, Y), axis=-1)[:, None, :]
+
+
+def _circle_collection(centers, radius, **kwargs):
+    """
+    Returns a PathCollection of circles in data coordinates, built directly from
+    paths rather than from individual Circle patches
+
+    Parameters
+    ----------
+    centers : list of (float, float)
+        The centers of the circles
+    radius : float
+        The radius shared by all circles
+    kwargs
+        Keyword arguments to be passed to the PathCollection
+    """
+    from matplotlib.collections import PathCollection
+
+    return PathCollection(_circle_paths(centers, radius), **kwargs)
+
+
+def _circle_paths(centers, radius):
+    """Returns a circle Path in data coordinates for each of <centers>"""
+    from matplotlib.path import Path
+
+    return [Path.circle(c, radius) for c in centers]
+
+
+def _symbol_text(op, X, Y):
+    """Returns the centered symbol Text of a CircleOp or DiamondOp at (X, Y)"""
+    from matplotlib.text import Text
+
+    return Text(X, Y, op.symbol, va="center", ha="center", **op.symbol_kwargs)
+
+
+@lru_cache(maxsize=64)
+def _shared_color(color):
+    return color
+
+
+def _intern_color(color):
+    """Returns a shared instance of <color>, so that ops with equal colors reference one object"""
+    try:
+        return _shared_color(color)
+    except TypeError:
+        # Unhashable colors, such as lists, are kept as-is
+        return color
+
+
+def _style_key(line_kwargs):
+    """Returns a hashable key for <line_kwargs>, or None if it can't be hashed"""
+    if line_kwargs is None:
+        return ()
+    key = tuple(sorted(line_kwargs.items()))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def merge_ops(ops_with_pairs):
+    """
+    Generates one LineCollection per distinct line style from line-only operations
+    (LinearOp, DenseOp, ArrowOp), rather than one LineCollection per operation
+
+    Parameters
+    ----------
+    ops_with_pairs : iterable of (op, BaseLayer, BaseLayer)
+        Each operation with the left-side and right-side objects it connects
+    """
+    from matplotlib.collections import LineCollection
+
+    buckets = {}
+    styles = {}
+    for op, objA, objB in ops_with_pairs:
+        segments, key = op._segments_and_style(objA, objB)
+        if key is None:
+            # Unhashable styling can't be shared, so give the op its own bucket
+            key = id(op)
+        if key not in buckets:
+            buckets[key] = []
+            styles[key] = op.line_kwargs
+        buckets[key].append(segments)
+
+    out = []
+    for key, bucket in buckets.items():
+        if all(isinstance(segs, np.ndarray) and segs.ndim == 3 for segs in bucket):
+            segments = np.concatenate(bucket)
+        else:
+            segments = [seg for segs in bucket for seg in segs]
+
+        out.append(
+            LineCollection(
+                segments,
+                ec="k",
+                **styles[key],
             )
-        return [(x + X, y + Y) for x, y in new_segments]
+        )
+    return out
+
+
+def _geom_key(obj):
+    """Returns a key identifying <obj> and the attributes which determine its geometry"""
+    return (id(obj), type(obj), obj._layout_token(), getattr(obj, "yival", None))
+
+
+def _memo_geom(op, objA, objB, params, calc):
+    """
+    Returns calc(objA, objB), reusing the result cached on <op> when neither
+    object has moved or resized and the op <params> are unchanged
+
+    The text_X side effect of <calc> is cached and restored along with it.
+    """
+    key = (_geom_key(objA), _geom_key(objB), params)
+    cached = op._geom_cache
+    if cached is not None and cached[0] == key:
+        op.text_X = cached[2]
+        return cached[1]
+    result = calc(objA, objB)
+    op._geom_cache = (key, result, op.text_X)
+    return result
+
+
+@lru_cache(maxsize=128)
+def _index_range(n, limit=None):
+    """
+    Returns the read-only indices of the features to connect on one side of a
+    DenseOp, cached so each (n, limit) pair is only built once
+
+    n : int
+        The number of features on that side
+    limit : int | None
+        If not None, then only the first and last <limit> indices are kept
+    """
+    if limit is None:
+        irange = np.arange(n)
     else:
-        return [(x + X, y + Y) for x, y in segments]
+        irange = np.concatenate((np.arange(limit), np.arange(n - limit, n)))
+    irange.flags.writeable = False
+    return irange
+
+
+def _dense_segments(
+    irange, jrange, baseX1, baseY1, ivalAX, ivalAY, baseX2, baseY2, ivalBX, ivalBY
+):
+    """
+    Returns an (N, 2, 2) array of line segments connecting every left-side
+    index in <irange> to every right-side index in <jrange>
+
+    The result is written into a single preallocated buffer, so no per-segment
+    or intermediate pairing arrays are created. The buffer is float64 since
+    LineCollection converts each segment to float64 anyway; other dtypes only
+    add a copy per segment.
+    """
+    out = np.empty((irange.size, jrange.size, 2, 2), dtype=np.float64)
+    out[:, :, 0, 0] = (baseX1 + ivalAX * irange)[:, None]
+    out[:, :, 0, 1] = (baseY1 - ivalAY * irange)[:, None]
+    out[:, :, 1, 0] = baseX2 + ivalBX * jrange
+    out[:, :, 1, 1] = baseY2 - ivalBY * jrange
+    return out.reshape(-1, 2, 2)
+
+
+def _conv_geom(BR_A, wA, hA, BR_B, wB, hB, kw, kh, reverse):
+    """
+    Returns the bottom-left points and (width, height) sizes of the two Conv2dOp
+    rectangles as (P1, size1, P2, size2)
+
+    BR_A, BR_B : ndarray (float, float)
+        The bottom-right corners of the left-side and right-side objects
+    wA, hA, wB, hB : float
+        The widths and heights of the left-side and right-side objects
+    kw, kh : int
+        The kernel dimensions
+    reverse : bool
+        Whether the kernel is drawn on the right-side object (upsampling)
+    """
+    if reverse:
+        P1 = BR_A + (-0.1 * wA, 0.1 * hA)
+        P2 = BR_B + (-max(0.9 * wB, kw), max(0.9 * hB - kh, 0))
+        return P1, (1, 1), P2, (kw, kh)
+
+    P1 = BR_A + (-min(wA, 0.1 * wA + kw), min(hA - kh, 0.1 * hA))
+    P2 = BR_B + (-0.9 * wB, 0.9 * hB - 1)
+    return P1, (kw, kh), P2, (1, 1)
 
 
 class Conv2dOp:
     """For plotting kernel operation visualizations between layers"""
 
+    __slots__ = (
+        "kernel",
+        "reverse",
+        "_label",
+        "_label_only",
+        "_stride",
+        "_text",
+        "loc",
+        "kernel_color",
+        "line_kwargs",
+        "text_kwargs",
+        "text_X",
+        "_geom_cache",
+    )
+
     def __init__(
         self,
         kernel: tuple = (4, 4),
@@ -101,17 +340,46 @@ class Conv2dOp:
 
         self.kernel = kernel
         self.reverse = reverse
-        if label_only:
-            self.text = label
-        else:
-            self.text = f"{label}\n{kernel[0]}x{kernel[1]} Kernel\nStride {stride}"
+        self._label = label
+        self._label_only = label_only
+        self._stride = stride
+        self._text = None
         self.loc = loc
-        self.kernel_color = kernel_color
-        self.line_kwargs = line_kwargs
-        self.text_kwargs = text_kwargs
+        self.kernel_color = _intern_color(kernel_color)
+        self.line_kwargs = line_kwargs or {}
+        self.text_kwargs = text_kwargs or {}
+        self._geom_cache = None
+
+    @property
+    def text(self):
+        """The label text, which is only formatted when first requested"""
+        if self._text is None:
+            if self._label_only:
+                self._text = self._label
+            else:
+                kw, kh = self.kernel
+                self._text = f"{self._label}\n{kw}x{kh} Kernel\nStride {self._stride}"
+        return self._text
 
-    def make_collection(self, objA, objB):
-        """Generates a PatchCollection and LineCollection containing all graphics to be drawn other than text
+    @text.setter
+    def text(self, value):
+        self._text = value
+
+    def _compute_geom(self, objA, objB):
+        """Returns the kernel rectangle vertices and connecting line segments, reusing
+        the last result if nothing has changed
+
+        objA : BaseLayer
+            The left-side object being connected
+        objB : BaseLayer
+            The right-side object being connected
+        """
+        return _memo_geom(
+            self, objA, objB, (tuple(self.kernel), self.reverse), self._calc_geom
+        )
+
+    def _calc_geom(self, objA, objB):
+        """Returns the kernel rectangle vertices and connecting line segments
 
         objA : BaseLayer
             The left-side object being connected
@@ -120,79 +388,78 @@ class Conv2dOp:
         """
         kw, kh = self.kernel
 
-        if self.reverse:
-            assert (
-                kw <= objB.width and kh <= objB.height
-            ), f"Kernel dimensions {(self.kernel)} can't be larger than layer dimensions {objB.width, objB.height}"
-
-            # TL, TR, BL, BR
-            _, _, _, BR = objA.get_corners()
-            X1 = BR[0] - 0.1 * objA.width
-            Y1 = BR[1] + 0.1 * objA.height
-
-            # TL, TR, BL, BR
-            _, _, _, BR = objB.get_corners()
-            X2 = BR[0] - max(0.9 * objB.width, kw)
-            Y2 = BR[1] + max(0.9 * objB.height - kh, 0)
-
-            colors = [self.kernel_color, self.kernel_color]
-            patches = [
-                Rectangle((X1, Y1), 1, 1),
-                Rectangle((X2, Y2), *self.kernel),
-            ]
-            pcol = PatchCollection(patches, ec="k", fc=colors)
+        # The kernel is drawn on the input layer, which is objB when reversed
+        src = objB if self.reverse else objA
+        assert (
+            kw <= src.width and kh <= src.height
+        ), f"Kernel dimensions {(self.kernel)} can't be larger than layer dimensions {src.width, src.height}"
+
+        P1, (w1, h1), P2, (w2, h2) = _conv_geom(
+            objA.get_corners_array()[3],
+            objA.width,
+            objA.height,
+            objB.get_corners_array()[3],
+            objB.width,
+            objB.height,
+            kw,
+            kh,
+            self.reverse,
+        )
 
-            segments = [
-                [(X1 + 1, Y1 + 1), (X2, Y2 + kh)],
-                [(X1 + 1, Y1), (X2, Y2)],
+        verts = np.stack((P1 + _UNIT_RECT * (w1, h1), P2 + _UNIT_RECT * (w2, h2)))
+        segments = np.array(
+            [
+                [P1 + (w1, h1), P2 + (0, h2)],
+                [P1 + (w1, 0), P2],
             ]
+        )
 
-            self.text_X = (X1 + kw + X2) / 2
+        self.text_X = float(P1[0] + kw + P2[0]) / 2
 
-            return pcol, LineCollection(
-                segments,
-                ec="k",
-                **self.line_kwargs if self.line_kwargs is not None else {},
-            )
-        else:
-            assert (
-                kw <= objA.width and kh <= objA.height
-            ), f"Kernel dimensions {(self.kernel)} can't be larger than layer dimensions {objA.width, objA.height}"
-
-            # TL, TR, BL, BR
-            _, _, _, BR = objA.get_corners()
-            X1 = BR[0] - min(objA.width, 0.1 * objA.width + kw)
-            Y1 = BR[1] + min(objA.height - kh, 0.1 * objA.height)
-
-            # TL, TR, BL, BR
-            _, _, _, BR = objB.get_corners()
-            X2 = BR[0] - 0.9 * objB.width
-            Y2 = BR[1] + 0.9 * objB.height - 1
-
-            colors = [self.kernel_color, self.kernel_color]
-            patches = [
-                Rectangle((X1, Y1), *self.kernel),
-                Rectangle((X2, Y2), 1, 1),
-            ]
-            pcol = PatchCollection(patches, ec="k", fc=colors)
+        return verts, segments
 
-            segments = [
-                [(X1 + kw, Y1 + kh), (X2, Y2 + 1)],
-                [(X1 + kw, Y1), (X2, Y2)],
-            ]
+    def make_collection(self, objA, objB):
+        """Generates a PolyCollection and LineCollection containing all graphics to be drawn other than text
 
-            self.text_X = (X1 + kw + X2) / 2
+        objA : BaseLayer
+            The left-side object being connected
+        objB : BaseLayer
+            The right-side object being connected
+        """
+        from matplotlib.collections import LineCollection, PolyCollection
 
-            return pcol, LineCollection(
-                segments,
-                ec="k",
-                **self.line_kwargs if self.line_kwargs is not None else {},
-            )
+        verts, segments = self._compute_geom(objA, objB)
+
+        colors = [self.kernel_color, self.kernel_color]
+        pcol = PolyCollection(verts, ec="k", fc=colors)
+
+        return pcol, LineCollection(
+            segments,
+            ec="k",
+            **self.line_kwargs,
+        )
+
+    def update(self, coll, objA, objB):
+        """Updates the graphics from make_collection in place, e.g. after the layers moved
+
+        coll : (PolyCollection, LineCollection)
+            The collections previously returned by make_collection
+        objA : BaseLayer
+            The left-side object being connected
+        objB : BaseLayer
+            The right-side object being connected
+        """
+        pcol, lcol = coll
+        verts, segments = self._compute_geom(objA, objB)
+        pcol.set_verts(verts)
+        lcol.set_segments(segments)
 
 
 class LinearOp:
     """For plotting simple diagonal lines between layers"""
 
+    __slots__ = ("text", "loc", "line_kwargs", "text_kwargs", "text_X", "_geom_cache")
+
     def __init__(
         self,
         label: str = "Linear",
@@ -214,11 +481,23 @@ class LinearOp:
         """
         self.text = label
         self.loc = loc
-        self.line_kwargs = line_kwargs
-        self.text_kwargs = text_kwargs
+        self.line_kwargs = line_kwargs or {}
+        self.text_kwargs = text_kwargs or {}
+        self._geom_cache = None
 
-    def make_collection(self, objA, objB):
-        """Generates a LineCollection containing all graphics to be drawn other than text
+    def _compute_segments(self, objA, objB):
+        """Returns the line segments connecting the two objects, reusing the last
+        result if nothing has changed
+
+        objA : BaseLayer
+            The left-side object being connected
+        objB : BaseLayer
+            The right-side object being connected
+        """
+        return _memo_geom(self, objA, objB, (), self._calc_segments)
+
+    def _calc_segments(self, objA, objB):
+        """Returns the line segments connecting the two objects
 
         objA : BaseLayer
             The left-side object being connected
@@ -230,22 +509,65 @@ class LinearOp:
         _, (X1, Y1), _, (X1_2, Y1_2) = objA.get_corners()
         (X2, Y2), _, (X2_2, Y2_2), _ = objB.get_corners()
 
-        segments = [
-            [(X1, Y1), (X2, Y2)],
-            [(X1_2, Y1_2), (X2_2, Y2_2)],
-        ]
+        segments = np.array(
+            [
+                [(X1, Y1), (X2, Y2)],
+                [(X1_2, Y1_2), (X2_2, Y2_2)],
+            ],
+            dtype=np.float64,
+        )
         self.text_X = (X1_2 + X2_2) / 2
 
+        return segments
+
+    def make_collection(self, objA, objB):
+        """Generates a LineCollection containing all graphics to be drawn other than text
+
+        objA : BaseLayer
+            The left-side object being connected
+        objB : BaseLayer
+            The right-side object being connected
+        """
+        from matplotlib.collections import LineCollection
+
         return LineCollection(
-            segments,
+            self._compute_segments(objA, objB),
             ec="k",
-            **self.line_kwargs if self.line_kwargs is not None else {},
+            **self.line_kwargs,
         )
 
+    def update(self, coll, objA, objB):
+        """Updates the LineCollection from make_collection in place, e.g. after the layers moved
+
+        coll : LineCollection
+            The collection previously returned by make_collection
+        objA : BaseLayer
+            The left-side object being connected
+        objB : BaseLayer
+            The right-side object being connected
+        """
+        coll.set_segments(self._compute_segments(objA, objB))
+
+    def _segments_and_style(self, objA, objB):
+        """Returns the line segments and a hashable key describing their styling, for merge_ops"""
+        return self._compute_segments(objA, objB), _style_key(self.line_kwargs)
+
 
 class DenseOp:
     """For plotting dense connection lines between layers"""
 
+    __slots__ = (
+        "numA",
+        "numB",
+        "text",
+        "loc",
+        "line_kwargs",
+        "text_kwargs",
+        "limited_ends",
+        "text_X",
+        "_geom_cache",
+    )
+
     def __init__(
         self,
         numA: int = 1,
@@ -281,12 +603,36 @@ class DenseOp:
         self.numB = numB
         self.text = label
         self.loc = loc
-        self.line_kwargs = line_kwargs
-        self.text_kwargs = text_kwargs
+        self.line_kwargs = line_kwargs or {}
+        self.text_kwargs = text_kwargs or {}
+        self._geom_cache = None
         self.limited_ends = limited_ends
 
-    def make_collection(self, objA, objB):
-        """Generates a LineCollection containing all graphics to be drawn other than text
+    def _limits(self):
+        """Returns limited_ends as a (left, right) pair"""
+        if isinstance(self.limited_ends, (list, tuple)):
+            return tuple(self.limited_ends)
+        return (self.limited_ends, self.limited_ends)
+
+    def _compute_segments(self, objA, objB):
+        """Returns the line segments connecting the two objects, reusing the last
+        result if nothing has changed
+
+        objA : BaseLayer
+            The left-side object being connected
+        objB : BaseLayer
+            The right-side object being connected
+        """
+        return _memo_geom(
+            self,
+            objA,
+            objB,
+            (self.numA, self.numB, self._limits()),
+            self._calc_segments,
+        )
+
+    def _calc_segments(self, objA, objB):
+        """Returns the line segments connecting the two objects
 
         objA : BaseLayer
             The left-side object being connected
@@ -298,18 +644,20 @@ class DenseOp:
         _, (X1, Y1), _, (X1_2, Y1_2) = objA.get_corners()
         (X2, Y2), _, (X2_2, Y2_2), _ = objB.get_corners()
 
-        if hasattr(objA, "yival"):
+        yivalA = getattr(objA, "yival", None)
+        if yivalA is not None:
             # Use pre-defined spacing, if available
-            ivalAY = objA.yival
+            ivalAY = yivalA
             offsetAY = objA.height / 2
         else:
             # Estimate spacing
             ivalAY = abs(Y1_2 - Y1) / self.numA
             offsetAY = ivalAY / 2
 
-        if hasattr(objB, "yival"):
+        yivalB = getattr(objB, "yival", None)
+        if yivalB is not None:
             # Use pre-defined spacing, if available
-            ivalBY = objB.yival
+            ivalBY = yivalB
             offsetBY = objB.height / 2
         else:
             # Estimate spacing
@@ -324,53 +672,76 @@ class DenseOp:
         baseX1 = X1 + ivalAX / 2
         baseX2 = X2 + ivalBX / 2
 
-        if self.limited_ends is None:
-            irange = range(self.numA)
-            jrange = range(self.numB)
-        elif isinstance(self.limited_ends, list) or isinstance(
-            self.limited_ends, tuple
-        ):
-            if self.limited_ends[0] is None:
-                irange = range(self.numA)
-            else:
-                irange = list(range(self.limited_ends[0])) + list(
-                    range(self.numA - self.limited_ends[0], self.numA)
-                )
-            if self.limited_ends[1] is None:
-                jrange = range(self.numB)
-            else:
-                jrange = list(range(self.limited_ends[1])) + list(
-                    range(self.numB - self.limited_ends[1], self.numB)
-                )
-        else:
-            irange = list(range(self.limited_ends)) + list(
-                range(self.numA - self.limited_ends, self.numA)
-            )
-            jrange = list(range(self.limited_ends)) + list(
-                range(self.numB - self.limited_ends, self.numB)
-            )
-
-        segments = []
-        for i in irange:
-            for j in jrange:
-                segments.append(
-                    [
-                        (baseX1 + ivalAX * i, baseY1 - ivalAY * i),
-                        (baseX2 + ivalBX * j, baseY2 - ivalBY * j),
-                    ]
-                )
+        limA, limB = self._limits()
+        irange = _index_range(self.numA, limA)
+        jrange = _index_range(self.numB, limB)
+
+        segments = _dense_segments(
+            irange,
+            jrange,
+            baseX1,
+            baseY1,
+            ivalAX,
+            ivalAY,
+            baseX2,
+            baseY2,
+            ivalBX,
+            ivalBY,
+        )
 
         self.text_X = (X1_2 + X2_2) / 2
+
+        return segments
+
+    def make_collection(self, objA, objB):
+        """Generates a LineCollection containing all graphics to be drawn other than text
+
+        objA : BaseLayer
+            The left-side object being connected
+        objB : BaseLayer
+            The right-side object being connected
+        """
+        from matplotlib.collections import LineCollection
+
         return LineCollection(
-            segments,
+            self._compute_segments(objA, objB),
             ec="k",
-            **self.line_kwargs if self.line_kwargs is not None else {},
+            **self.line_kwargs,
         )
 
+    def update(self, coll, objA, objB):
+        """Updates the LineCollection from make_collection in place, e.g. after the layers moved
+
+        coll : LineCollection
+            The collection previously returned by make_collection
+        objA : BaseLayer
+            The left-side object being connected
+        objB : BaseLayer
+            The right-side object being connected
+        """
+        coll.set_segments(self._compute_segments(objA, objB))
+
+    def _segments_and_style(self, objA, objB):
+        """Returns the line segments and a hashable key describing their styling, for merge_ops"""
+        return self._compute_segments(objA, objB), _style_key(self.line_kwargs)
+
 
 class ArrowOp:
     """For plotting horizontal arrows between layers"""
 
+    __slots__ = (
+        "text",
+        "arrow_size",
+        "arrow_offset",
+        "offset",
+        "draw_lines",
+        "loc",
+        "line_kwargs",
+        "text_kwargs",
+        "text_X",
+        "_geom_cache",
+    )
+
     def __init__(
         self,
         label: str = "Arrow",
@@ -408,11 +779,34 @@ class ArrowOp:
         self.offset = offset
         self.draw_lines = draw_lines
         self.loc = loc
-        self.line_kwargs = line_kwargs
-        self.text_kwargs = text_kwargs
+        self.line_kwargs = line_kwargs or {}
+        self.text_kwargs = text_kwargs or {}
+        self._geom_cache = None
 
-    def make_collection(self, objA, objB):
-        """Generates a LineCollection containing all graphics to be drawn other than text
+    def _compute_segments(self, objA, objB):
+        """Returns the line segments of the arrow and its connecting lines, reusing
+        the last result if nothing has changed
+
+        objA : BaseLayer
+            The left-side object being connected
+        objB : BaseLayer
+            The right-side object being connected
+        """
+        return _memo_geom(
+            self,
+            objA,
+            objB,
+            (
+                self.arrow_size,
+                self.arrow_offset,
+                self.offset,
+                self.draw_lines,
+            ),
+            self._calc_segments,
+        )
+
+    def _calc_segments(self, objA, objB):
+        """Returns the line segments of the arrow and its connecting lines
 
         objA : BaseLayer
             The left-side object being connected
@@ -429,31 +823,73 @@ class ArrowOp:
         Xmid = (X2 + X1) / 2 + self.arrow_offset
         Ymid = (Y2 + Y1) / 2
 
+        # Every segment is a view into one (8, 2) buffer laid out as
+        # [arrowhead (4) | left line (2) | right line (2)], so a single array is
+        # allocated per call and LineCollection can use the views as-is
+        h = self.arrow_size / 2
+        buf = np.empty((8, 2), dtype=np.float64)
+        buf[0] = buf[3] = (Xmid + h, Ymid)
+        buf[1] = (Xmid - h, Ymid + h)
+        buf[2] = (Xmid - h, Ymid - h)
+        buf[4] = (X1 + self.offset, Y1)
+        buf[5] = (Xmid - h, Ymid)
+        buf[6] = (Xmid + h, Ymid)
+        buf[7] = (X2 - self.offset, Y2)
+
+        segments = []
+
         if self.arrow_size > 0:
-            segments = [make_arrow(Xmid, Ymid, self.arrow_size, self.arrow_size)]
-        else:
-            segments = []
+            segments.append(buf[0:4])
 
         if self.draw_lines:
-            segments.extend(
-                [
-                    [(X1 + self.offset, Y1), (Xmid - self.arrow_size / 2, Ymid)],
-                    [(Xmid + self.arrow_size / 2, Ymid), (X2 - self.offset, Y2)],
-                ]
-            )
+            segments.append(buf[4:6])
+            segments.append(buf[6:8])
 
         self.text_X = (X1 + X2) / 2
 
+        return segments
+
+    def make_collection(self, objA, objB):
+        """Generates a LineCollection containing all graphics to be drawn other than text
+
+        objA : BaseLayer
+            The left-side object being connected
+        objB : BaseLayer
+            The right-side object being connected
+        """
+        from matplotlib.collections import LineCollection
+
         return LineCollection(
-            segments,
+            self._compute_segments(objA, objB),
             ec="k",
-            **self.line_kwargs if self.line_kwargs is not None else {},
+            **self.line_kwargs,
         )
 
+    def update(self, coll, objA, objB):
+        """Updates the LineCollection from make_collection in place, e.g. after the layers moved
+
+        coll : LineCollection
+            The collection previously returned by make_collection
+        objA : BaseLayer
+            The left-side object being connected
+        objB : BaseLayer
+            The right-side object being connected
+        """
+        coll.set_segments(self._compute_segments(objA, objB))
+
+    def _segments_and_style(self, objA, objB):
+        """Returns the line segments and a hashable key describing their styling, for merge_ops"""
+        return self._compute_segments(objA, objB), _style_key(self.line_kwargs)
+
 
 class BlankOp:
     """For use when no operation should be shown between layers"""
 
+    __slots__ = ("text", "loc", "text_kwargs", "text_X")
+
+    # Lets renderers skip make_collection, since there is nothing to draw
+    is_blank = True
+
     def __init__(
         self,
         label: str = "Blank",
@@ -472,10 +908,10 @@ class BlankOp:
         """
         self.text = label
         self.loc = loc
-        self.text_kwargs = text_kwargs
+        self.text_kwargs = text_kwargs or {}
 
-    def make_collection(self, objA, objB):
-        """Since no graphics are drawn only the text X position is calculated
+    def compute_text_x(self, objA, objB):
+        """Calculates the text X position, which is all that is needed for a blank op
 
         objA : BaseLayer
             The left-side object being connected
@@ -486,12 +922,48 @@ class BlankOp:
         _, _, _, (X1, Y1) = objA.get_corners()
         _, _, (X2, Y2), _ = objB.get_corners()
         self.text_X = (X1 + X2) / 2
+
+    def make_collection(self, objA, objB):
+        """Since no graphics are drawn only the text X position is calculated, and None is returned
+
+        objA : BaseLayer
+            The left-side object being connected
+        objB : BaseLayer
+            The right-side object being connected
+        """
+        self.compute_text_x(objA, objB)
         return None
 
+    def update(self, coll, objA, objB):
+        """Recalculates the text X position, as there are no graphics to update
+
+        coll : None
+            The value previously returned by make_collection
+        objA : BaseLayer
+            The left-side object being connected
+        objB : BaseLayer
+            The right-side object being connected
+        """
+        self.compute_text_x(objA, objB)
+
 
 class ResidualOp:
     """For plotting residual arrows between layers"""
 
+    __slots__ = (
+        "text",
+        "arrow_size",
+        "xoffset",
+        "yoffset",
+        "show_vert_arrows",
+        "show_hori_segments",
+        "connection_radius",
+        "loc",
+        "line_kwargs",
+        "text_kwargs",
+        "text_X",
+    )
+
     def __init__(
         self,
         label: str = "Residual",
@@ -539,11 +1011,11 @@ class ResidualOp:
         self.show_hori_segments = show_hori_segments
         self.connection_radius = connection_radius
         self.loc = loc
-        self.line_kwargs = line_kwargs
-        self.text_kwargs = text_kwargs
+        self.line_kwargs = line_kwargs or {}
+        self.text_kwargs = text_kwargs or {}
 
-    def make_collection(self, objA, objB):
-        """Generates a LineCollection containing all graphics to be drawn other than text
+    def _compute_geom(self, objA, objB):
+        """Returns the line segments and the centers of the connection dots
 
         objA : BaseLayer
             The left-side object being connected
@@ -560,87 +1032,105 @@ class ResidualOp:
         Xmid = (X1 + X2) / 2
         Ymid = min(Y2, Y1) + self.yoffset
 
-        segments = []
+        # Both polylines are views into one (8, 2) buffer laid out as
+        # [left polyline (4) | right polyline (4)]; the outer point of each is
+        # the short horizontal segment, which is dropped when not shown
+        buf = np.empty((8, 2), dtype=np.float64)
+        buf[0] = (X1, Y1)
+        buf[1] = (X1 + self.xoffset, Y1)
+        buf[2] = (X1 + self.xoffset, Ymid)
+        buf[3] = (Xmid - self.arrow_size / 2, Ymid)
+        buf[4] = (Xmid + self.arrow_size / 2, Ymid)
+        buf[5] = (X2 - self.xoffset, Ymid)
+        buf[6] = (X2 - self.xoffset, Y2)
+        buf[7] = (X2, Y2)
 
         if self.show_hori_segments:
-            segments.append(
-                [
-                    (X1, Y1),
-                    (X1 + self.xoffset, Y1),
-                    (X1 + self.xoffset, Ymid),
-                    (Xmid - self.arrow_size / 2, Ymid),
-                ]
-            )
-            segments.append(
-                [
-                    (Xmid + self.arrow_size / 2, Ymid),
-                    (X2 - self.xoffset, Ymid),
-                    (X2 - self.xoffset, Y2),
-                    (X2, Y2),
-                ]
-            )
+            segments = [buf[0:4], buf[4:8]]
         else:
-            segments.append(
-                [
-                    (X1 + self.xoffset, Y1),
-                    (X1 + self.xoffset, Ymid),
-                    (Xmid - self.arrow_size / 2, Ymid),
-                ]
-            )
-            segments.append(
-                [
-                    (Xmid + self.arrow_size / 2, Ymid),
-                    (X2 - self.xoffset, Ymid),
-                    (X2 - self.xoffset, Y2),
-                ]
-            )
-
-        segments.append(make_arrow(Xmid, Ymid, self.arrow_size, self.arrow_size))
+            segments = [buf[1:4], buf[4:7]]
 
         if self.show_vert_arrows:
-            segments.append(
-                make_arrow(
-                    X1 + self.xoffset,
-                    Y1 + self.yoffset / 2,
-                    self.arrow_size,
-                    self.arrow_size,
-                    rotation=-90,
-                )
-            )
-            segments.append(
-                make_arrow(
-                    X2 - self.xoffset,
-                    Y2 + self.yoffset / 2,
-                    self.arrow_size,
-                    self.arrow_size,
-                    rotation=90,
-                )
+            arrows = make_arrows(
+                (Xmid, X1 + self.xoffset, X2 - self.xoffset),
+                (Ymid, Y1 + self.yoffset / 2, Y2 + self.yoffset / 2),
+                self.arrow_size,
+                self.arrow_size,
+                (0, -90, 90),
             )
+        else:
+            arrows = make_arrows(Xmid, Ymid, self.arrow_size, self.arrow_size)
+        segments.extend(arrows)
 
         self.text_X = (X1 + X2) / 2
 
+        return segments, [(X1 + self.xoffset, Y1), (X2 - self.xoffset, Y2)]
+
+    def make_collection(self, objA, objB):
+        """Generates a LineCollection containing all graphics to be drawn other than text
+
+        objA : BaseLayer
+            The left-side object being connected
+        objB : BaseLayer
+            The right-side object being connected
+        """
+        from matplotlib.collections import LineCollection
+
+        segments, centers = self._compute_geom(objA, objB)
+
         out = [
             LineCollection(
                 segments,
                 ec="k",
-                **self.line_kwargs if self.line_kwargs is not None else {},
+                **self.line_kwargs,
                 zorder=-10,
             )
         ]
 
         if self.connection_radius > 0:
-            circles = [
-                Circle((X1 + self.xoffset, Y1), self.connection_radius),
-                Circle((X2 - self.xoffset, Y2), self.connection_radius),
-            ]
-            out.append(PatchCollection(circles, ec="k", fc="k"))
+            out.append(
+                _circle_collection(
+                    centers,
+                    self.connection_radius,
+                    ec="k",
+                    fc="k",
+                )
+            )
 
         return out
 
+    def update(self, coll, objA, objB):
+        """Updates the graphics from make_collection in place, e.g. after the layers moved
+
+        coll : list of (LineCollection, PathCollection)
+            The collections previously returned by make_collection
+        objA : BaseLayer
+            The left-side object being connected
+        objB : BaseLayer
+            The right-side object being connected
+        """
+        segments, centers = self._compute_geom(objA, objB)
+        coll[0].set_segments(segments)
+        if len(coll) > 1:
+            coll[1].set_paths(_circle_paths(centers, self.connection_radius))
+
 
 class CircleOp:
     """For plotting circled symbols between layers"""
 
+    __slots__ = (
+        "text",
+        "symbol",
+        "diameter",
+        "symbol_kwargs",
+        "fill_color",
+        "offset",
+        "loc",
+        "line_kwargs",
+        "text_kwargs",
+        "text_X",
+    )
+
     def __init__(
         self,
         label: str = "Circle",
@@ -678,15 +1168,15 @@ class CircleOp:
         self.text = label
         self.symbol = symbol
         self.diameter = diameter
-        self.symbol_kwargs = symbol_kwargs
+        self.symbol_kwargs = symbol_kwargs or {}
         self.fill_color = fill_color
         self.offset = offset
         self.loc = loc
-        self.line_kwargs = line_kwargs
-        self.text_kwargs = text_kwargs
+        self.line_kwargs = line_kwargs or {}
+        self.text_kwargs = text_kwargs or {}
 
-    def make_collection(self, objA, objB):
-        """Generates a LineCollection containing all graphics to be drawn other than text
+    def _compute_geom(self, objA, objB):
+        """Returns the connecting line segments and the center of the circle
 
         objA : BaseLayer
             The left-side object being connected
@@ -703,38 +1193,74 @@ class CircleOp:
         Xmid = (X2 + X1) / 2
         Ymid = (Y2 + Y1) / 2
 
-        segments = [
-            [(X1 + self.offset, Y1), (Xmid - self.diameter / 2, Ymid)],
-            [(Xmid + self.diameter / 2, Ymid), (X2 - self.offset, Y2)],
-        ]
-
-        circle = [Circle((Xmid, Ymid), self.diameter / 2)]
-
-        txt = Text(
-            Xmid,
-            Ymid,
-            self.symbol,
-            va="center",
-            ha="center",
-            **self.symbol_kwargs if self.symbol_kwargs is not None else {},
+        segments = np.array(
+            [
+                [(X1 + self.offset, Y1), (Xmid - self.diameter / 2, Ymid)],
+                [(Xmid + self.diameter / 2, Ymid), (X2 - self.offset, Y2)],
+            ],
+            dtype=np.float64,
         )
 
         self.text_X = (X1 + X2) / 2
 
+        return segments, (Xmid, Ymid)
+
+    def make_collection(self, objA, objB):
+        """Generates a LineCollection containing all graphics to be drawn other than text
+
+        objA : BaseLayer
+            The left-side object being connected
+        objB : BaseLayer
+            The right-side object being connected
+        """
+        from matplotlib.collections import LineCollection
+
+        segments, center = self._compute_geom(objA, objB)
+
         return (
             LineCollection(
                 segments,
                 ec="k",
-                **self.line_kwargs if self.line_kwargs is not None else {},
+                **self.line_kwargs,
             ),
-            PatchCollection(circle, ec="k", fc=self.fill_color),
-            txt,
+            _circle_collection([center], self.diameter / 2, ec="k", fc=self.fill_color),
+            _symbol_text(self, *center),
         )
 
+    def update(self, coll, objA, objB):
+        """Updates the graphics from make_collection in place, e.g. after the layers moved
+
+        coll : (LineCollection, PathCollection, Text)
+            The graphics previously returned by make_collection
+        objA : BaseLayer
+            The left-side object being connected
+        objB : BaseLayer
+            The right-side object being connected
+        """
+        lcol, ccol, txt = coll
+        segments, center = self._compute_geom(objA, objB)
+        lcol.set_segments(segments)
+        ccol.set_paths(_circle_paths([center], self.diameter / 2))
+        txt.set_position(center)
+
 
 class DiamondOp:
     """For plotting diamond-enclosed symbols between layers"""
 
+    __slots__ = (
+        "text",
+        "symbol",
+        "width",
+        "height",
+        "symbol_kwargs",
+        "fill_color",
+        "offset",
+        "loc",
+        "line_kwargs",
+        "text_kwargs",
+        "text_X",
+    )
+
     def __init__(
         self,
         label: str = "Diamond",
@@ -776,15 +1302,16 @@ class DiamondOp:
         self.symbol = symbol
         self.width = width
         self.height = height
-        self.symbol_kwargs = symbol_kwargs
+        self.symbol_kwargs = symbol_kwargs or {}
         self.fill_color = fill_color
         self.offset = offset
         self.loc = loc
-        self.line_kwargs = line_kwargs
-        self.text_kwargs = text_kwargs
+        self.line_kwargs = line_kwargs or {}
+        self.text_kwargs = text_kwargs or {}
 
-    def make_collection(self, objA, objB):
-        """Generates a LineCollection containing all graphics to be drawn other than text
+    def _compute_geom(self, objA, objB):
+        """Returns the connecting line segments, the diamond vertices and the
+        center of the diamond
 
         objA : BaseLayer
             The left-side object being connected
@@ -801,47 +1328,80 @@ class DiamondOp:
         Xmid = (X2 + X1) / 2
         Ymid = (Y2 + Y1) / 2
 
-        segments = [
-            [(X1 + self.offset, Y1), (Xmid - self.width / 2, Ymid)],
-            [(Xmid + self.width / 2, Ymid), (X2 - self.offset, Y2)],
-        ]
+        segments = np.array(
+            [
+                [(X1 + self.offset, Y1), (Xmid - self.width / 2, Ymid)],
+                [(Xmid + self.width / 2, Ymid), (X2 - self.offset, Y2)],
+            ],
+            dtype=np.float64,
+        )
 
-        poly = [
-            Polygon(
-                [
-                    (Xmid - self.width / 2, Ymid),
-                    (Xmid, Ymid + self.height / 2),
-                    (Xmid + self.width / 2, Ymid),
-                    (Xmid, Ymid - self.height / 2),
-                ]
-            )
+        verts = [
+            [
+                (Xmid - self.width / 2, Ymid),
+                (Xmid, Ymid + self.height / 2),
+                (Xmid + self.width / 2, Ymid),
+                (Xmid, Ymid - self.height / 2),
+            ]
         ]
 
-        txt = Text(
-            Xmid,
-            Ymid,
-            self.symbol,
-            va="center",
-            ha="center",
-            **self.symbol_kwargs if self.symbol_kwargs is not None else {},
-        )
-
         self.text_X = (X1 + X2) / 2
 
+        return segments, verts, (Xmid, Ymid)
+
+    def make_collection(self, objA, objB):
+        """Generates a LineCollection containing all graphics to be drawn other than text
+
+        objA : BaseLayer
+            The left-side object being connected
+        objB : BaseLayer
+            The right-side object being connected
+        """
+        from matplotlib.collections import LineCollection, PolyCollection
+
+        segments, verts, center = self._compute_geom(objA, objB)
+
         return (
             LineCollection(
                 segments,
                 ec="k",
-                **self.line_kwargs if self.line_kwargs is not None else {},
+                **self.line_kwargs,
             ),
-            PatchCollection(poly, ec="k", fc=self.fill_color),
-            txt,
+            PolyCollection(verts, ec="k", fc=self.fill_color),
+            _symbol_text(self, *center),
         )
 
+    def update(self, coll, objA, objB):
+        """Updates the graphics from make_collection in place, e.g. after the layers moved
+
+        coll : (LineCollection, PolyCollection, Text)
+            The graphics previously returned by make_collection
+        objA : BaseLayer
+            The left-side object being connected
+        objB : BaseLayer
+            The right-side object being connected
+        """
+        lcol, pcol, txt = coll
+        segments, verts, center = self._compute_geom(objA, objB)
+        lcol.set_segments(segments)
+        pcol.set_verts(verts)
+        txt.set_position(center)
+
 
 class EllipsisOp:
     """For plotting ellipsis (...) between layers"""
 
+    __slots__ = (
+        "text",
+        "diameter",
+        "fill_color",
+        "offset",
+        "loc",
+        "line_kwargs",
+        "text_kwargs",
+        "text_X",
+    )
+
     def __init__(
         self,
         label: str = "Ellipsis",
@@ -876,11 +1436,11 @@ class EllipsisOp:
         self.fill_color = fill_color
         self.offset = offset
         self.loc = loc
-        self.line_kwargs = line_kwargs
-        self.text_kwargs = text_kwargs
+        self.line_kwargs = line_kwargs or {}
+        self.text_kwargs = text_kwargs or {}
 
-    def make_collection(self, objA, objB):
-        """Generates a LineCollection containing all graphics to be drawn other than text
+    def _compute_geom(self, objA, objB):
+        """Returns the centers of the circles
 
         objA : BaseLayer
             The left-side object being connected
@@ -902,12 +1462,33 @@ class EllipsisOp:
         else:
             ival = self.offset
 
-        circle = [
-            Circle((Xmid - ival, Ymid), self.diameter / 2),
-            Circle((Xmid, Ymid), self.diameter / 2),
-            Circle((Xmid + ival, Ymid), self.diameter / 2),
-        ]
-
         self.text_X = (X1 + X2) / 2
 
-        return PatchCollection(circle, ec="k", fc=self.fill_color)
+        return [(Xmid - ival, Ymid), (Xmid, Ymid), (Xmid + ival, Ymid)]
+
+    def make_collection(self, objA, objB):
+        """Generates a PathCollection containing all graphics to be drawn other than text
+
+        objA : BaseLayer
+            The left-side object being connected
+        objB : BaseLayer
+            The right-side object being connected
+        """
+        return _circle_collection(
+            self._compute_geom(objA, objB),
+            self.diameter / 2,
+            ec="k",
+            fc=self.fill_color,
+        )
+
+    def update(self, coll, objA, objB):
+        """Updates the PathCollection from make_collection in place, e.g. after the layers moved
+
+        coll : PathCollection
+            The collection previously returned by make_collection
+        objA : BaseLayer
+            The left-side object being connected
+        objB : BaseLayer
+            The right-side object being connected
+        """
+        coll.set_paths(_circle_paths(self._compute_geom(objA, objB), self.diameter / 2))
@@ -5,17 +5,111 @@
 # LICENSE file in the root directory of this source tree.
 
 
-import matplotlib.pyplot as plt
+from contextlib import nullcontext
+
+import matplotlib
 from matplotlib.artist import Artist
 from matplotlib.collections import Collection
+from matplotlib.font_manager import FontProperties
+import numpy as np
 
-from pydrawnet.layers import Layer1DDiagonal
+from pydrawnet.layers import merge_collections
+from pydrawnet.operations import merge_ops
 
 # For <text_kwargs> options see: https://matplotlib.org/stable/users/explain/text/text_props.html
 # For <line_kwargs> options see: https://matplotlib.org/stable/api/collections_api.html#matplotlib.collections.LineCollection
 
 
+# loc: (direction, va relative to the layer, va relative to the plot limits)
+_LABEL_POS = {"below": (-1, "top", "bottom"), "above": (1, "bottom", "top")}
+
+
+def _label_base(c):
+    """Returns the Y position labels are offset from for layer <c>"""
+    return c.Y if c.is_diagonal else c.Y + c.height
+
+
+# Text keyword arguments which only set font properties, by FontProperties name
+_FONT_KWARGS = {
+    "family": "family",
+    "fontfamily": "family",
+    "name": "family",
+    "fontname": "family",
+    "size": "size",
+    "fontsize": "size",
+    "style": "style",
+    "fontstyle": "style",
+    "variant": "variant",
+    "fontvariant": "variant",
+    "weight": "weight",
+    "fontweight": "weight",
+    "stretch": "stretch",
+    "fontstretch": "stretch",
+    "math_fontfamily": "math_fontfamily",
+}
+
+
+def _shared_font_kwargs(text_kwargs, fonts):
+    """
+    Returns <text_kwargs> with the font settings replaced by a FontProperties
+    shared through <fonts>, a dict of the FontProperties made so far
+
+    <text_kwargs> is returned unchanged if it already sets the font properties
+    directly, or if its font settings can't be hashed.
+    """
+    if "fontproperties" in text_kwargs or "font_properties" in text_kwargs:
+        return text_kwargs
+
+    font = {}
+    other = {}
+    for key, value in text_kwargs.items():
+        if key in _FONT_KWARGS:
+            font[_FONT_KWARGS[key]] = tuple(value) if isinstance(value, list) else value
+        else:
+            other[key] = value
+
+    key = tuple(sorted(font.items()))
+    try:
+        fp = fonts.get(key)
+    except TypeError:
+        return text_kwargs
+    if fp is None:
+        fp = fonts[key] = FontProperties(**font)
+
+    other["fontproperties"] = fp
+    return other
+
+
+def _pyplot():
+    """Imports pyplot on first use, so that importing pydrawnet doesn't set up a
+    GUI backend for scripts that only draw on their own axes"""
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+# Whether each type of graphic seen so far is added as a Collection or an Artist
+_IS_COLLECTION = {}
+
+
+def _as_op_list(operation):
+    """Returns <operation> as a list of operations, so render loops can iterate it"""
+    if isinstance(operation, (list, tuple)):
+        return list(operation)
+    return [operation]
+
+
 class BaseRenderer:
+    __slots__ = (
+        "axs",
+        "fig",
+        "collections",
+        "operations",
+        "_artists",
+        "_label_artists",
+        "_own_fig",
+    )
+
     def __init__(self, axs=None) -> None:
         """
         Parameters
@@ -29,42 +123,186 @@ class BaseRenderer:
 
         self.collections = []
         self.operations = []
+        self._artists = []
+        self._label_artists = []
+
+        # Whether the axis belongs to a figure made by make_figure
+        self._own_fig = False
 
     def get_limits(self, xmargin=0.05, ymargin=0.3):
         """Calculate the overall size of the model, with margins"""
-        xmin = None
-        xmax = None
-        ymin = None
-        ymax = None
-
-        if isinstance(self.collections, list):
-            colls = self.collections
-        elif isinstance(self.collections, dict):
+        if isinstance(self.collections, dict):
             colls = self.collections.values()
+        else:
+            colls = self.collections
 
-        for c in colls:
-            XL, XH, YL, YH = c.get_extents()
-            if xmin is None:
-                xmin = XL
-                xmax = XH
-                ymin = YL
-                ymax = YH
-            else:
-                xmin = min(xmin, XL)
-                xmax = max(xmax, XH)
-                ymin = min(ymin, YL)
-                ymax = max(ymax, YH)
+        # Columns: Xmin, Xmax, Ymin, Ymax
+        extents = np.array([c.get_extents() for c in colls], dtype=np.float64)
+        xmin, ymin = extents[:, [0, 2]].min(axis=0)
+        xmax, ymax = extents[:, [1, 3]].max(axis=0)
 
         xofst = (xmax - xmin) * xmargin
         yofst = (ymax - ymin) * ymargin
 
-        return xmin - xofst, xmax + xofst, ymin - yofst, ymax + yofst
+        return (
+            float(xmin - xofst),
+            float(xmax + xofst),
+            float(ymin - yofst),
+            float(ymax + yofst),
+        )
+
+    def _add_item(self, item):
+        """Adds a graphic returned by make_collection to the axis, keeping track of
+        it so that it can be removed again by a later render"""
+        if item is None:
+            return
+
+        is_collection = _IS_COLLECTION.get(type(item))
+        if is_collection is None:
+            if isinstance(item, Collection):
+                is_collection = True
+            elif isinstance(item, Artist):
+                is_collection = False
+            else:
+                raise TypeError("Unrecognised object type for rendering")
+            _IS_COLLECTION[type(item)] = is_collection
+
+        if is_collection:
+            # Limits are set explicitly from the layer extents instead
+            self.axs.add_collection(item, autolim=False)
+        else:
+            self.axs.add_artist(item)
+        self._artists.append(item)
+
+    def _prepare_axis(self, force_new_figure=False):
+        """Makes a figure if needed, otherwise removes the graphics and labels added
+        to the axis by the previous render so the figure can be reused"""
+        if self.axs is None or force_new_figure:
+            self.make_figure()
+        else:
+            children = set(self.axs.get_children())
+            for artist in self._artists + self._label_artists:
+                if artist in children:
+                    artist.remove()
+
+        self._artists = []
+        self._label_artists = []
+
+    def _draw(
+        self,
+        items,
+        xmargin,
+        ymargin,
+        text_y_offset,
+        offset_from_limits,
+        show,
+        hide_axis,
+    ):
+        """Sizes the axis, then adds <items> and the labels to it"""
+        interactive = matplotlib.is_interactive()
+
+        # Pause interactive auto-drawing while the axis is updated, so the canvas is
+        # redrawn once at the end instead of after each change
+        with _pyplot().ioff() if interactive else nullcontext():
+            # Size the axis once before adding any graphics, so adding them doesn't
+            # need to update the data limits
+            XL, XH, YL, YH = self.get_limits(xmargin, ymargin)
+            self.axs.set_xlim(XL, XH)
+            self.axs.set_ylim(YL, YH)
+            if XH > XL and YH > YL:
+                # An equal aspect can't be applied to zero-sized limits
+                self._set_equal_aspect()
+
+            for item in items:
+                self._add_item(item)
+
+            self._plot_labels(YL, YH, text_y_offset, offset_from_limits)
+
+            if hide_axis:
+                self._hide_axis()
+
+        if show:
+            _pyplot().show()
+        elif interactive:
+            self.axs.figure.canvas.draw_idle()
+
+    def _set_equal_aspect(self):
+        """Sets an equal aspect ratio, unless a previous render already did"""
+        if self.axs.get_aspect() != 1:
+            self.axs.set_aspect("equal")
+
+    def _hide_axis(self):
+        """Turns the axis off, unless a previous render already did"""
+        if self.axs.axison:
+            self.axs.axis("off")
+
+    def _layer_label(self, c, YL, YH, text_y_offset, offset_from_limits):
+        """Returns the label spec (X, Y, text, va, text_kwargs) for layer <c>"""
+        sign, va_layer, va_limit = _LABEL_POS.get(c.loc, _LABEL_POS["above"])
+
+        if offset_from_limits:
+            Y = (YL if sign < 0 else YH) - sign * text_y_offset
+            va = va_limit
+        else:
+            Y = _label_base(c) + sign * text_y_offset
+            va = va_layer
+
+        return (c.X + c.width / 2, Y, c.text, va, c.text_kwargs)
+
+    def _op_label(self, op, objA, objB, YL, YH, text_y_offset, offset_from_limits):
+        """Returns the label spec (X, Y, text, va, text_kwargs) for operation <op>
+        connecting <objA> to <objB>"""
+        sign, va_layer, va_limit = _LABEL_POS.get(op.loc, _LABEL_POS["above"])
+
+        if offset_from_limits:
+            Y = (YL if sign < 0 else YH) - sign * text_y_offset
+            va = va_limit
+        elif sign < 0:
+            Y1 = _label_base(objA) - objA.tot_height
+            Y2 = _label_base(objB) - objB.tot_height
+            Y = min(Y1, Y2) - text_y_offset
+            va = va_layer
+        else:
+            Y = max(_label_base(objA), _label_base(objB)) + text_y_offset
+            va = va_layer
+
+        return (op.text_X, Y, op.text, va, op.text_kwargs)
+
+    def _add_labels(self, specs):
+        """Adds the text labels to the axis in a single pass
+
+        Labels with the same font settings share one FontProperties, which each
+        Text copies, instead of every Text building its own from rcParams.
+
+        specs : list of (X, Y, text, va, text_kwargs)
+            The position, content, vertical alignment and styling of each label
+        """
+        text = self.axs.text
+        fonts = {}
+        artists = []
+        for X, Y, s, va, kwargs in specs:
+            kwargs = _shared_font_kwargs(kwargs, fonts)
+            artists.append(text(X, Y, s, va=va, ha="center", **kwargs))
+        self._label_artists = artists
 
     def make_figure(self, size=None):
-        self.fig, ax = plt.subplots()
+        self.fig, ax = _pyplot().subplots()
         if size is not None:
             self.fig.set_size_inches(size)
         self.axs = self.fig.axes[0]
+        self._own_fig = True
+
+    def close(self):
+        """Closes the figure made by make_figure, if any, so that pyplot releases it.
+        An axis passed in by the user is left untouched"""
+        if not self._own_fig:
+            return
+
+        _pyplot().close(self.fig)
+        self.axs = None
+        self._own_fig = False
+        self._artists = []
+        self._label_artists = []
 
     def add_layer(self, layer):
         raise NotImplementedError("Function must be overridden in subclass.")
@@ -79,6 +317,8 @@ class BaseRenderer:
 class FreeformRenderer(BaseRenderer):
     """Builds and renders a visualization of the network with arbitrary placement"""
 
+    __slots__ = ()
+
     def __init__(self, axs=None) -> None:
         super().__init__(axs)
 
@@ -86,7 +326,7 @@ class FreeformRenderer(BaseRenderer):
         self.operations = []
 
     def add_layer(self, layer, ID, overwrite=False):
-        if not overwrite and ID in list(self.collections.keys()):
+        if not overwrite and ID in self.collections:
             raise KeyError(
                 f'Entry with ID "{ID}" already exists. Use overwrite to ignore.'
             )
@@ -97,111 +337,24 @@ class FreeformRenderer(BaseRenderer):
         return self.collections.pop(ID, None)
 
     def add_operation(self, operation, ID1, ID2):
-        self.operations.append([operation, ID1, ID2])
+        self.operations.append([_as_op_list(operation), ID1, ID2])
 
     def _plot_labels(self, YL, YH, text_y_offset=10, offset_from_limits=False):
-        for c in self.collections.values():
-            # If there is text to plot
-            if c.text is not None and len(c.text) > 0:
-                if c.loc == "below":
-                    if offset_from_limits:
-                        Y = YL + text_y_offset
-                        va = "bottom"
-                    else:
-                        Y = c.Y - text_y_offset
-                        if not isinstance(c, Layer1DDiagonal):
-                            Y += c.height
-                        va = "top"
-
-                    self.axs.text(
-                        c.X + c.width / 2,
-                        Y,
-                        c.text,
-                        va=va,
-                        ha="center",
-                        **c.text_kwargs if c.text_kwargs is not None else {},
-                    )
-                else:
-                    if offset_from_limits:
-                        Y = YH - text_y_offset
-                        va = "top"
-                    else:
-                        Y = c.Y + text_y_offset
-                        if not isinstance(c, Layer1DDiagonal):
-                            Y += c.height
-                        va = "bottom"
-
-                    self.axs.text(
-                        c.X + c.width / 2,
-                        Y,
-                        c.text,
-                        va=va,
-                        ha="center",
-                        **c.text_kwargs if c.text_kwargs is not None else {},
-                    )
-
-        for subset in self.operations:
-            ops, ID1, ID2 = subset
-            if not isinstance(ops, list) and not isinstance(ops, tuple):
-                ops = [ops]
+        args = (YL, YH, text_y_offset, offset_from_limits)
+
+        # Only layers and operations with text to plot
+        specs = [
+            self._layer_label(c, *args) for c in self.collections.values() if c.text
+        ]
+
+        for ops, ID1, ID2 in self.operations:
+            objA, objB = self.collections[ID1], self.collections[ID2]
 
             for op in ops:
-                # If there is text to plot
-                if op.text is not None and len(op.text) > 0:
-                    if op.loc == "below":
-                        if offset_from_limits:
-                            Ypos = YL + text_y_offset
-                            va = "bottom"
-                        else:
-                            Y = (
-                                self.collections[ID1].Y
-                                - self.collections[ID1].tot_height
-                            )
-                            if not isinstance(self.collections[ID1], Layer1DDiagonal):
-                                Y += self.collections[ID1].height
-
-                            Y2 = (
-                                self.collections[ID2].Y
-                                - self.collections[ID2].tot_height
-                            )
-                            if not isinstance(self.collections[ID2], Layer1DDiagonal):
-                                Y2 += self.collections[ID2].height
-
-                            Ypos = min(Y, Y2) - text_y_offset
-                            va = "top"
-
-                        self.axs.text(
-                            op.text_X,
-                            Ypos,
-                            op.text,
-                            va=va,
-                            ha="center",
-                            **op.text_kwargs if op.text_kwargs is not None else {},
-                        )
-                    else:
-                        if offset_from_limits:
-                            Ypos = YH - text_y_offset
-                            va = "top"
-                        else:
-                            Y = self.collections[ID1].Y
-                            if not isinstance(self.collections[ID1], Layer1DDiagonal):
-                                Y += self.collections[ID1].height
-
-                            Y2 = self.collections[ID2].Y
-                            if not isinstance(self.collections[ID2], Layer1DDiagonal):
-                                Y2 += self.collections[ID2].height
-
-                            Ypos = max(Y, Y2) + text_y_offset
-                            va = "bottom"
-
-                        self.axs.text(
-                            op.text_X,
-                            Ypos,
-                            op.text,
-                            va=va,
-                            ha="center",
-                            **op.text_kwargs if op.text_kwargs is not None else {},
-                        )
+                if op.text:
+                    specs.append(self._op_label(op, objA, objB, *args))
+
+        self._add_labels(specs)
 
     def render(
         self,
@@ -211,185 +364,99 @@ class FreeformRenderer(BaseRenderer):
         text_y_offset=10,
         show=True,
         hide_axis=True,
+        force_new_figure=False,
     ):
-        def _add_item(item):
-            if isinstance(item, Collection):
-                self.axs.add_collection(item)
-            elif isinstance(item, Artist):
-                self.axs.add_artist(item)
-            elif item is None:
-                pass
-            else:
-                raise TypeError("Unrecognised object type for rendering")
+        self._prepare_axis(force_new_figure)
 
-        if self.axs is None:
-            self.make_figure()
-
-        for c in self.collections.values():
-            _add_item(c.make_collection())
+        items = []
 
-        for subset in self.operations:
-            ops, ID1, ID2 = subset
+        # Layer graphics are combined into as few collections as possible
+        for coll in merge_collections(
+            [c.make_collection() for c in self.collections.values()]
+        ):
+            items.append(coll)
 
-            if not isinstance(ops, list) and not isinstance(ops, tuple):
-                ops = [ops]
+        line_ops = []
+        for ops, ID1, ID2 in self.operations:
+            objA, objB = self.collections[ID1], self.collections[ID2]
 
             for op in ops:
-                coll = op.make_collection(self.collections[ID1], self.collections[ID2])
+                if getattr(op, "is_blank", False):
+                    # Nothing to draw, only the label position is needed
+                    op.compute_text_x(objA, objB)
+                    continue
 
-                if isinstance(coll, tuple) or isinstance(coll, list):
-                    for c in coll:
-                        _add_item(c)
-                else:
-                    # Account for "blank" ops
-                    if coll is not None:
-                        _add_item(coll)
+                if hasattr(op, "_segments_and_style"):
+                    line_ops.append((op, objA, objB))
+                    continue
 
-        XL, XH, YL, YH = self.get_limits(xmargin, ymargin)
-        self.axs.set_xlim(XL, XH)
-        self.axs.set_ylim(YL, YH)
-        self.axs.set_aspect("equal")
+                coll = op.make_collection(objA, objB)
 
-        self._plot_labels(YL, YH, text_y_offset, offset_from_limits)
+                if isinstance(coll, (tuple, list)):
+                    items.extend(coll)
+                elif coll is not None:
+                    items.append(coll)
 
-        if hide_axis:
-            self.axs.axis("off")
+        # Line-only operations are drawn as one LineCollection per line style
+        for coll in merge_ops(line_ops):
+            items.append(coll)
 
-        if show:
-            plt.show()
+        self._draw(
+            items, xmargin, ymargin, text_y_offset, offset_from_limits, show, hide_axis
+        )
 
 
 class SeqRenderer(BaseRenderer):
     """Builds and renders a sequential visualization of the network"""
 
+    __slots__ = ()
+
     def add_layer(self, layer):
         self.collections.append(layer)
 
     def add_operation(self, operation):
-        self.operations.append(operation)
+        self.operations.append(_as_op_list(operation))
 
     def calculate_spacing(self, hspace=200, dspace=300):
         """Calculate and update the required X-axis positioning of each layer"""
+        hspace_narrow = hspace * 1.5
         X = 0
         b = 0
         lastX = 0
         for i, c in enumerate(self.collections):
             c.calc_overall_sizes()
+            Y = c.Y
+            tot_width = c.tot_width
 
             if i > 0:
                 # Diagonal Spacing
-                X = dspace + b - c.Y
+                X = dspace + b - Y
 
-            if X > lastX or X + c.tot_width < lastX:
+            if X > lastX or X + tot_width < lastX:
                 # Horizontal Spacing
-                if c.tot_width < hspace:
-                    X = lastX + hspace * 1.5
+                if tot_width < hspace:
+                    X = lastX + hspace_narrow
                 else:
                     X = lastX + hspace
 
-            b = X + c.width + c.Y + c.height
-            lastX = X + c.tot_width
+            b = X + c.width + Y + c.height
+            lastX = X + tot_width
             c.X = X
 
     def _plot_labels(self, YL, YH, text_y_offset=10, offset_from_limits=False):
-        for c in self.collections:
-            # If there is text to plot
-            if c.text is not None and len(c.text) > 0:
-                if c.loc == "below":
-                    if offset_from_limits:
-                        Y = YL + text_y_offset
-                        va = "bottom"
-                    else:
-                        Y = c.Y - text_y_offset
-                        if not isinstance(c, Layer1DDiagonal):
-                            Y += c.height
-                        va = "top"
-
-                    self.axs.text(
-                        c.X + c.width / 2,
-                        Y,
-                        c.text,
-                        va=va,
-                        ha="center",
-                        **c.text_kwargs if c.text_kwargs is not None else {},
-                    )
-                else:
-                    if offset_from_limits:
-                        Y = YH - text_y_offset
-                        va = "top"
-                    else:
-                        Y = c.Y + text_y_offset
-                        if not isinstance(c, Layer1DDiagonal):
-                            Y += c.height
-                        va = "bottom"
-
-                    self.axs.text(
-                        c.X + c.width / 2,
-                        Y,
-                        c.text,
-                        va=va,
-                        ha="center",
-                        **c.text_kwargs if c.text_kwargs is not None else {},
-                    )
+        args = (YL, YH, text_y_offset, offset_from_limits)
+
+        # Only layers and operations with text to plot
+        specs = [self._layer_label(c, *args) for c in self.collections if c.text]
 
         for i, ops in enumerate(self.operations):
-            if not isinstance(ops, list) and not isinstance(ops, tuple):
-                ops = [ops]
+            objA, objB = self.collections[i], self.collections[i + 1]
 
             for op in ops:
-                # If there is text to plot
-                if op.text is not None and len(op.text) > 0:
-                    if op.loc == "below":
-                        if offset_from_limits:
-                            Ypos = YL + text_y_offset
-                            va = "bottom"
-                        else:
-                            Y = self.collections[i].Y - self.collections[i].tot_height
-                            if not isinstance(self.collections[i], Layer1DDiagonal):
-                                Y += self.collections[i].height
-
-                            Y2 = (
-                                self.collections[i + 1].Y
-                                - self.collections[i + 1].tot_height
-                            )
-                            if not isinstance(self.collections[i + 1], Layer1DDiagonal):
-                                Y2 += self.collections[i + 1].height
-
-                            Ypos = min(Y, Y2) - text_y_offset
-                            va = "top"
-
-                        self.axs.text(
-                            op.text_X,
-                            Ypos,
-                            op.text,
-                            va=va,
-                            ha="center",
-                            **op.text_kwargs if op.text_kwargs is not None else {},
-                        )
-                    else:
-                        if offset_from_limits:
-                            Ypos = YH - text_y_offset
-                            va = "top"
-                        else:
-                            Y = self.collections[i].Y
-                            if not isinstance(self.collections[i], Layer1DDiagonal):
-                                Y += self.collections[i].height
-
-                            Y2 = self.collections[i + 1].Y
-                            if not isinstance(self.collections[i + 1], Layer1DDiagonal):
-                                Y2 += self.collections[i + 1].height
-
-                            Ypos = max(Y, Y2) + text_y_offset
-                            va = "bottom"
-
-                        self.axs.text(
-                            op.text_X,
-                            Ypos,
-                            op.text,
-                            va=va,
-                            ha="center",
-                            **op.text_kwargs if op.text_kwargs is not None else {},
-                        )
+                if op.text:
+                    specs.append(self._op_label(op, objA, objB, *args))
+
+        self._add_labels(specs)
 
     def render(
         self,
@@ -402,6 +469,7 @@ class SeqRenderer(BaseRenderer):
         text_y_offset=10,
         show=True,
         hide_axis=True,
+        force_new_figure=False,
     ):
         """Visualize the model in the order that layers and operations were added
 
@@ -423,24 +491,16 @@ class SeqRenderer(BaseRenderer):
             Whether to call plt.show()
         hide_axis : bool
             Whether to turn off the axes of the plot
+        force_new_figure : bool
+            Whether to draw on a new figure. Otherwise the existing axis is reused,
+            replacing anything drawn on it by a previous render
         """
 
-        def _add_item(item):
-            if isinstance(item, Collection):
-                self.axs.add_collection(item)
-            elif isinstance(item, Artist):
-                self.axs.add_artist(item)
-            elif item is None:
-                pass
-            else:
-                raise TypeError("Unrecognised object type for rendering")
-
         assert len(self.operations) < len(
             self.collections
         ), "There must be fewer operations than graphics/layers"
 
-        if self.axs is None:
-            self.make_figure()
+        self._prepare_axis(force_new_figure)
 
         if manual_xpos is None:
             self.calculate_spacing(hspace, dspace)
@@ -451,33 +511,37 @@ class SeqRenderer(BaseRenderer):
             for i in range(len(self.collections)):
                 self.collections[i].X = manual_xpos[i]
 
-        for c in self.collections:
-            _add_item(c.make_collection())
+        items = []
 
+        # Layer graphics are combined into as few collections as possible
+        for coll in merge_collections([c.make_collection() for c in self.collections]):
+            items.append(coll)
+
+        line_ops = []
         for i, ops in enumerate(self.operations):
-            if not isinstance(ops, list) and not isinstance(ops, tuple):
-                ops = [ops]
+            objA, objB = self.collections[i], self.collections[i + 1]
 
             for op in ops:
-                coll = op.make_collection(self.collections[i], self.collections[i + 1])
+                if getattr(op, "is_blank", False):
+                    # Nothing to draw, only the label position is needed
+                    op.compute_text_x(objA, objB)
+                    continue
 
-                if isinstance(coll, tuple) or isinstance(coll, list):
-                    for c in coll:
-                        _add_item(c)
-                else:
-                    # Account for "blank" ops
-                    if coll is not None:
-                        _add_item(coll)
+                if hasattr(op, "_segments_and_style"):
+                    line_ops.append((op, objA, objB))
+                    continue
 
-        XL, XH, YL, YH = self.get_limits(xmargin, ymargin)
-        self.axs.set_xlim(XL, XH)
-        self.axs.set_ylim(YL, YH)
-        self.axs.set_aspect("equal")
+                coll = op.make_collection(objA, objB)
 
-        self._plot_labels(YL, YH, text_y_offset, offset_from_limits)
+                if isinstance(coll, (tuple, list)):
+                    items.extend(coll)
+                elif coll is not None:
+                    items.append(coll)
 
-        if hide_axis:
-            self.axs.axis("off")
+        # Line-only operations are drawn as one LineCollection per line style
+        for coll in merge_ops(line_ops):
+            items.append(coll)
 
-        if show:
-            plt.show()
+        self._draw(
+            items, xmargin, ymargin, text_y_offset, offset_from_limits, show, hide_axis
+        )
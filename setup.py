@@ -15,18 +15,18 @@ setup(
     author_email="nato5342@hotmail.com",
     license="BSD 3-clause",
     packages=["pydrawnet"],
-    install_requires=["matplotlib"],
+    install_requires=["matplotlib", "numpy"],
     classifiers=[
         "Development Status :: 1 - Planning",
         "Intended Audience :: Science/Research",
         "License :: OSI Approved :: BSD License",
-        "Operating System :: Microsoft :: Windows :: Windows 10",
+        "Operating System :: OS Independent",
         "Topic :: Scientific/Engineering :: Visualization",
-        "Programming Language :: Python :: 2",
-        "Programming Language :: Python :: 2.7",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.4",
-        "Programming Language :: Python :: 3.5",
-        "Programming Language :: Python :: 3.14",
+        "Programming Language :: Python :: 3 :: Only",
+        "Programming Language :: Python :: 3.10",
+        "Programming Language :: Python :: 3.11",
+        "Programming Language :: Python :: 3.12",
     ],
+    python_requires=">=3.10",
 )
@@ -0,0 +1,73 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+from matplotlib.collections import LineCollection, PatchCollection
+from matplotlib.patches import Rectangle
+import matplotlib.pyplot as plt
+
+from pydrawnet import layers, operations
+from pydrawnet.renderers import SeqRenderer
+
+
+class HatchedBlockLayer(layers.BlockLayer):
+    """A user-defined layer drawn with non-default collection properties"""
+
+    __slots__ = ()
+
+    def make_collection(self):
+        return PatchCollection(
+            [Rectangle((self.X, self.Y), self.width, self.height)],
+            fc=self.fill_color,
+            ec="k",
+            alpha=0.3,
+            hatch="//",
+            linestyle="--",
+            zorder=5,
+        )
+
+
+def _layer_collections(SR):
+    return [c for c in SR.axs.collections if not isinstance(c, LineCollection)]
+
+
+def test_builtin_layers_are_merged():
+    SR = SeqRenderer()
+    SR.add_layer(layers.BlockLayer(10, 100))
+    for _ in range(2):
+        SR.add_operation(operations.ArrowOp(""))
+        SR.add_layer(layers.BlockLayer(10, 100))
+    SR.render(show=False)
+
+    colls = _layer_collections(SR)
+    assert len(colls) == 1
+    assert len(colls[0].get_paths()) == 3
+    plt.close("all")
+
+
+def test_custom_layer_keeps_its_properties():
+    SR = SeqRenderer()
+    SR.add_layer(layers.BlockLayer(10, 100))
+    SR.add_operation(operations.ArrowOp(""))
+    SR.add_layer(HatchedBlockLayer(10, 100))
+    SR.add_operation(operations.ArrowOp(""))
+    SR.add_layer(layers.BlockLayer(10, 100))
+    SR.render(show=False)
+
+    colls = _layer_collections(SR)
+    hatched = [c for c in colls if c.get_hatch() is not None]
+    assert len(hatched) == 1
+    custom = hatched[0]
+    assert custom.get_hatch() == "//"
+    assert custom.get_zorder() == 5
+    assert custom.get_alpha() == 0.3
+    assert all(dashes is not None for _, dashes in custom.get_linestyle())
+
+    # The built-in layers are still drawn, with their default properties
+    builtin = [c for c in colls if c is not custom]
+    assert sum(len(c.get_paths()) for c in builtin) == 2
+    for c in builtin:
+        assert c.get_hatch() is None
+        assert c.get_zorder() == 1
+        assert all(dashes is None for _, dashes in c.get_linestyle())
+    plt.close("all")